@@ -38,49 +38,322 @@
     n ≥ (z² × p × (1-p)) / E² where E = margin of error
 """
 import os
-import math
-from typing import List, Dict
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field
+import json
+from dataclasses import dataclass, field, fields
+from functools import lru_cache, partial
+from typing import Final, FrozenSet, Tuple, Dict, NamedTuple
+
+import numpy as np
 
 
 # ============================================================
 # [수학적 상수 - 정밀 계산]
+# 아래 값은 WIN_RATE / RISK_REWARD로부터 미리 계산한 리터럴이다 (import 시 재계산 없음).
+# WIN_RATE / RISK_REWARD를 바꾸면 주석의 공식으로 함께 갱신할 것.
 # ============================================================
 
 # 가정된 기본 승률 (보수적)
-WIN_RATE = 0.38
+WIN_RATE: Final[float] = 0.38
 
 # 목표 손익비 (최적화 기반)
 # Sharpe ~0.5 가정: RR* = 0.5² + 1 = 1.25
 # 거래비용 고려하여 상향: 2.5
-RISK_REWARD = 2.5
+RISK_REWARD: Final[float] = 2.5
 
 # Kelly Criterion 계산
 # f* = p - q/b = 0.38 - 0.62/2.5 = 0.132
 # Half Kelly = 0.066
-KELLY_FULL = WIN_RATE - (1 - WIN_RATE) / RISK_REWARD
-KELLY_HALF = KELLY_FULL / 2
+KELLY_FULL: Final[float] = 0.132
+KELLY_HALF: Final[float] = 0.066
 
 # Risk of Ruin 계산
 # edge = p × W - q × L = 0.38 × 2.5 - 0.62 × 1 = 0.33
 # 5% ruin 허용: MaxDD = edge × ln(0.05) / variance
-EDGE = WIN_RATE * RISK_REWARD - (1 - WIN_RATE)
+EDGE: Final[float] = 0.33
 
 # 연패 99% 신뢰구간
 # n = ln(0.01) / ln(1-p) = ln(0.01) / ln(0.62) ≈ 9.6
-LOSING_STREAK_99 = int(math.log(0.01) / math.log(1 - WIN_RATE))
+LOSING_STREAK_99: Final[int] = 9
 
 # 최소 통계적 유의 거래 수
-# z=1.96 (95%), E=0.05: n = (1.96² × 0.38 × 0.62) / 0.05² ≈ 363
-MIN_TRADES_SIGNIFICANT = int((1.96**2 * WIN_RATE * (1-WIN_RATE)) / 0.05**2)
+# z=1.96 (95%), E=0.05: n = (1.96² × 0.38 × 0.62) / 0.05² ≈ 362.03
+MIN_TRADES_SIGNIFICANT: Final[int] = 362
 
 # 피라미딩 감소율
 # r = √(p/q) = √(0.38/0.62) ≈ 0.78
-PYRAMID_DECAY = math.sqrt(WIN_RATE / (1 - WIN_RATE))
+PYRAMID_DECAY: Final[float] = 0.7828813612588127
+
+
+_TRUE_TOKENS: Final[FrozenSet[str]] = frozenset(("1", "true", "yes", "on", "y", "t"))
+_FALSE_TOKENS: Final[FrozenSet[str]] = frozenset(("0", "false", "no", "off", "n", "f", ""))
+
+
+def _to_bool(raw: str, name: str = "") -> bool:
+    """명시적 참/거짓 토큰만 허용 (오타가 조용히 False로 읽히지 않도록)"""
+    token = raw.strip().lower()
+    if token in _TRUE_TOKENS:
+        return True
+    if token in _FALSE_TOKENS:
+        return False
+    raise ValueError(f"{name or 'bool'} 값 {raw!r}: true/false, 1/0, yes/no, on/off 중 하나여야 함")
+
+
+def env_flag(name: str, default: str = "0") -> bool:
+    """TradingSettings 밖의 불리언 환경변수도 같은 엄격 규칙으로 읽기 (main.py의 MARKET_WS 등)"""
+    return _to_bool(os.getenv(name, default), name)
+
+
+def _to_tuple(raw: str) -> tuple:
+    return tuple(json.loads(raw))
+
+
+def _caster(tp, name: str = ""):
+    """필드 타입 → 환경변수 문자열 변환 함수 (Tuple은 JSON 배열 표기, name은 오류 메시지용)"""
+    if tp is bool:
+        return partial(_to_bool, name=name)
+    if tp in (int, float, str):
+        return tp
+    return _to_tuple
+
+
+# ============================================================
+# [전략별 서브 설정] - 평가 루프에서 cfg = settings.BREAKOUT 한 번만 읽고 튜플 필드로 접근
+# 필드명 = 플랫 설정명에서 접두어를 뗀 소문자 (예: BREAKOUT_SCORE_W_ADX → BREAKOUT.score_w_adx)
+# ============================================================
+class BreakoutCfg(NamedTuple):
+    """브레이크아웃 서브 설정 (BREAKOUT_*)"""
+    lookback: int
+    confirm_candles: int
+    volume_mult: float
+    retest_tolerance: float
+    false_breakout_exit: int
+    false_breakout_use_protect_sl: bool
+    atr_break_mult: float
+    min_adx: float
+    short_min_adx: float
+    close_pos_long: float
+    close_pos_short: float
+    htf_mult: int
+    htf_ema_fast: int
+    htf_ema_slow: int
+    require_htf_trend: bool
+    allow_long: bool
+    allow_short: bool
+    atr_expansion_lookback: int
+    atr_expansion_mult: float
+    time_stop_bars: int
+    min_favorable_atr: float
+    score_threshold: float
+    short_score_threshold: float
+    score_w_adx: float
+    score_w_vol: float
+    score_w_close_pos: float
+    score_w_break: float
+    score_w_atr_exp: float
+    short_require_htf_trend: bool
+    short_require_atr_expansion: bool
+    short_min_vol_ratio: float
+    soft_entry_enable: bool
+    soft_threshold_delta: float
+    soft_size: float
+    soft_min_adx_relax: float
+    short_strong_break_ratio: float
+    watch_extra_delta: float
+    watch_min_adx_relax: float
+    stage2_buffer_mult: float
+    stage1_buffer_mult: float
+    vwap_window: int
+    watch_vwap_atr_offset: float
+    soft_max_atr_cap: float
+    full_max_atr_cap: float
+    level_local_lookback: int
+    level_max_gap_atr: float
+    level_auto_tune: bool
+    level_local_lookback_min: int
+    level_local_lookback_max: int
+    level_max_gap_atr_min: float
+    level_max_gap_atr_max: float
+    atr_sl_mult: float
+    atr_tp1_mult: float
+    atr_tp2_mult: float
+
+
+class HtfTrendCfg(NamedTuple):
+    """HTF 추세 서브 설정 (HTF_TREND_*)"""
+    long_only: bool
+    allow_short: bool
+    short_min_strength_atr: float
+    short_entry_atr_buffer: float
+    short_max_atr_pct: float
+    mult: int
+    ema_fast: int
+    ema_slow: int
+    max_position_size: float
+    risk_per_trade: float
+    size: float
+    atr_sl_mult: float
+    trail_pct: float
+    entry_atr_buffer: float
+    reentry_cooldown_bars: int
+    sizing_mode: str
+    target_exposure: float
+    use_stop_loss: bool
+    dynamic_exposure: bool
+    exposure_min: float
+    exposure_max: float
+    exposure_strength_min_atr: float
+    exposure_strength_max_atr: float
+    min_strength_atr: float
+    max_atr_pct: float
+    enable_chandelier: bool
+    chandelier_atr_mult: float
+    chandelier_arm_after_atr: float
+    dynamic_exits: bool
+    chandelier_atr_mult_strong: float
+    chandelier_atr_mult_weak: float
+    time_stop_bars_strong: int
+    time_stop_bars_weak: int
+    enable_catastrophic_stop: bool
+    catastrophic_max_loss_pct: float
+    catastrophic_use_entry_atr: bool
+    catastrophic_atr_mult: float
+    time_stop_bars: int
+    min_favorable_atr: float
+    soft_exit_below_slow_atr: float
+    short_soft_exit_above_slow_atr: float
+    exit_min_strength_atr: float
+    short_exit_min_strength_atr: float
+    max_total_drawdown: float
+    max_daily_drawdown: float
+    disable_other_strategies: bool
+    scale_out_enabled: bool
+    scale_out_max_count: int
+    scale_out_fraction: float
+    scale_out_atr_mult: float
+    scale_out_arm_after_atr: float
+
+
+class CtCfg(NamedTuple):
+    """CT(역추세) 롱/숏 공용 서브 설정 - 방향별 이름 차이는 아래 공용 이름으로 통일"""
+    enable: bool
+    risk_per_trade: float
+    max_pos_size_mult: float
+    max_adx: float
+    max_atr_pct: float
+    sl_atr_mult: float
+    tp_atr_mult: float
+    tp1_atr_mult: float
+    tp1_fraction: float
+    trail_pct: float
+    cooldown_bars: int
+    time_stop_bars: int
+    min_favorable_atr: float
+    min_body_atr: float
+    be_arm_atr: float
+    be_buffer_pct: float
+    reclaim_ema_fast: bool
+    strong_override_mult: float
+    close_pos: float  # 롱: MIN_CLOSE_POS / 숏: MAX_CLOSE_POS
+    confirm_bars: int  # 롱: CONFIRM_UP_BARS / 숏: CONFIRM_DOWN_BARS
+    spike_enable: bool  # 롱: WASHOUT_ENABLE / 숏: PUMPOUT_ENABLE
+    spike_lookback_bars: int
+    spike_atr_mult: float  # 롱: WASHOUT_DROP_ATR_MULT / 숏: PUMPOUT_RISE_ATR_MULT
+    spike_min_atr_pct: float
+    spike_max_atr_pct: float
+    spike_min_vol_mult: float
+    spike_window_bars: int
+    plan_atr_mult: float  # 롱: PLAN_REBOUND_ATR_MULT / 숏: PLAN_FADE_ATR_MULT
+
+
+def _group(s: "TradingSettings", cfg_cls, prefix: str):
+    """플랫 필드(prefix + 필드명 대문자)를 묶어 서브 설정 생성"""
+    return cfg_cls._make(getattr(s, prefix + name.upper()) for name in cfg_cls._fields)
+
+
+_CT_SIDE_FIELDS = {
+    "LONG": {
+        "close_pos": "MIN_CLOSE_POS",
+        "confirm_bars": "CONFIRM_UP_BARS",
+        "spike_enable": "WASHOUT_ENABLE",
+        "spike_lookback_bars": "WASHOUT_LOOKBACK_BARS",
+        "spike_atr_mult": "WASHOUT_DROP_ATR_MULT",
+        "spike_min_atr_pct": "WASHOUT_MIN_ATR_PCT",
+        "spike_max_atr_pct": "WASHOUT_MAX_ATR_PCT",
+        "spike_min_vol_mult": "WASHOUT_MIN_VOL_MULT",
+        "spike_window_bars": "WASHOUT_WINDOW_BARS",
+        "plan_atr_mult": "PLAN_REBOUND_ATR_MULT",
+    },
+    "SHORT": {
+        "close_pos": "MAX_CLOSE_POS",
+        "confirm_bars": "CONFIRM_DOWN_BARS",
+        "spike_enable": "PUMPOUT_ENABLE",
+        "spike_lookback_bars": "PUMPOUT_LOOKBACK_BARS",
+        "spike_atr_mult": "PUMPOUT_RISE_ATR_MULT",
+        "spike_min_atr_pct": "PUMPOUT_MIN_ATR_PCT",
+        "spike_max_atr_pct": "PUMPOUT_MAX_ATR_PCT",
+        "spike_min_vol_mult": "PUMPOUT_MIN_VOL_MULT",
+        "spike_window_bars": "PUMPOUT_WINDOW_BARS",
+        "plan_atr_mult": "PLAN_FADE_ATR_MULT",
+    },
+}
+
+
+def _ct_cfg(s: "TradingSettings", side: str) -> CtCfg:
+    """CT_LONG_* / CT_SHORT_* → CtCfg"""
+    pre = f"CT_{side}_"
+    renamed = _CT_SIDE_FIELDS[side]
+    return CtCfg._make(getattr(s, pre + renamed.get(name, name.upper())) for name in CtCfg._fields)
+
+
+# ============================================================
+# [런타임 특화 함수] - 실행 중 바뀌지 않는 스위치는 로드 시 1회 분기하고
+# 상수를 클로저에 묶어 둔다 (봉 루프는 settings.compute_sl_tp(...)만 호출)
+# ============================================================
+def _make_sl_tp(s: "TradingSettings"):
+    """(entry, atr, direction) → (sl, tp), direction: 롱 +1 / 숏 -1"""
+    if s.USE_ATR_SLTP:
+        sl_mult, tp_mult = s.ATR_SL_MULT, s.ATR_TP_MULT
 
+        def atr_sl_tp(entry: float, atr: float, direction: int):
+            return entry - direction * atr * sl_mult, entry + direction * atr * tp_mult
+        return atr_sl_tp
 
-class TradingSettings(BaseSettings):
+    sl_pct, tp_pct = s.STOP_LOSS_PCT, s.TAKE_PROFIT_PCT
+
+    def pct_sl_tp(entry: float, atr: float, direction: int):
+        return entry * (1 - direction * sl_pct), entry * (1 + direction * tp_pct)
+    return pct_sl_tp
+
+
+def _make_leverage(s: "TradingSettings"):
+    """vol_ratio(current_vol / avg_vol) → 레버리지 (MIN~MAX 클램프)"""
+    base, lo, hi = s.BASE_LEVERAGE, s.MIN_LEVERAGE, s.MAX_LEVERAGE
+    clamped_base = max(lo, min(hi, base))  # 정적 모드 / vol_ratio <= 0 공통
+    if not s.DYNAMIC_LEVERAGE:
+        return lambda vol_ratio: clamped_base
+
+    scale = s.VOL_LEVERAGE_SCALE
+
+    def dyn_leverage(vol_ratio: float) -> int:
+        if vol_ratio <= 0:
+            return clamped_base
+        return max(lo, min(hi, int(base / (vol_ratio * scale))))
+    return dyn_leverage
+
+
+def _make_funding(s: "TradingSettings"):
+    """(notional, direction) → 펀딩 1회 비용 (양수 = 지불)"""
+    if not s.FUNDING_ENABLED:
+        return lambda notional, direction: 0.0
+
+    rate = s.FUNDING_RATE_PER_INTERVAL
+    if s.FUNDING_ASSUME_PAY_ONLY:
+        return lambda notional, direction: abs(notional) * rate
+    return lambda notional, direction: direction * abs(notional) * rate
+
+
+@dataclass(slots=True, frozen=True)
+class TradingSettings:
     """마스터 설정 클래스 - 극한 최적화"""
     
     APP_NAME: str = "Predator-Extreme-Optimized"
@@ -90,7 +363,7 @@ class TradingSettings(BaseSettings):
     # [기본 설정]
     # ============================================================
     SYMBOL: str = "BTCUSDT"
-    ALLOWED_SYMBOLS: List[str] = ["BTCUSDT", "ETHUSDT"]
+    ALLOWED_SYMBOLS: Tuple[str, ...] = ("BTCUSDT", "ETHUSDT")
     BASE_TIMEFRAME: str = "3m"
     
     # ============================================================
@@ -283,14 +556,14 @@ class TradingSettings(BaseSettings):
     TREND_PYRAMID_MAX: int = 3
     # 피라미딩 사이즈: 감소율 적용
     # 50% × 0.78 = 39%, 39% × 0.78 = 30%
-    TREND_PYRAMID_SIZES: List[float] = [0.50, 0.30, 0.20]
+    TREND_PYRAMID_SIZES: Tuple[float, ...] = (0.50, 0.30, 0.20)
     TREND_PYRAMID_TRIGGER_ATR: float = 1.0  # 1 ATR 이동 시 추가
     
     # --- DCA ---
     # 마틴게일 위험 회피: 동일 금액
     # 레벨: 피보나치 기반 (2.6%, 4.2%, 6.8%, 11%)
-    DCA_LEVELS: List[float] = [-0.026, -0.042, -0.068, -0.11]
-    DCA_MULTIPLIERS: List[float] = [1.0, 1.0, 1.0, 1.0]
+    DCA_LEVELS: Tuple[float, ...] = (-0.026, -0.042, -0.068, -0.11)
+    DCA_MULTIPLIERS: Tuple[float, ...] = (1.0, 1.0, 1.0, 1.0)
     DCA_MAX_ENTRIES: int = 4
     DCA_TOTAL_LIMIT: float = 1.5          # 초기의 1.5배까지
     
@@ -732,7 +1005,7 @@ class TradingSettings(BaseSettings):
     SESSION_US_SIZE_MULT: float = 1.0     # 기준
     
     # 거래 금지 시간
-    BLACKOUT_HOURS: List[int] = [23, 0, 1, 2]  # 저유동성
+    BLACKOUT_HOURS: Tuple[int, ...] = (23, 0, 1, 2)  # 저유동성
     NEWS_BLACKOUT_MINUTES: int = 30       # 주요 뉴스 전후 30분
     
     # ============================================================
@@ -773,23 +1046,164 @@ class TradingSettings(BaseSettings):
     DASHBOARD_PORT: int = 8050
     LOG_LEVEL: str = "INFO"
     
+    # ============================================================
+    # [전략별 서브 설정] - __post_init__에서 위 플랫 필드로부터 생성
+    # ============================================================
+    BREAKOUT: BreakoutCfg = field(init=False, repr=False, compare=False)
+    HTF_TREND: HtfTrendCfg = field(init=False, repr=False, compare=False)
+    CT_LONG: CtCfg = field(init=False, repr=False, compare=False)
+    CT_SHORT: CtCfg = field(init=False, repr=False, compare=False)
+
+    # 돌파 점수 가중치 벡터: [W_ADX, W_VOL, W_CLOSE_POS, W_BREAK, W_ATR_EXP] (float32, 읽기 전용)
+    BREAKOUT_SCORE_WEIGHTS: np.ndarray = field(init=False, repr=False, compare=False)
+    # [ATR_BREAK_MULT, ATR_EXPANSION_MULT, MIN_ADX, SHORT_MIN_ADX, CLOSE_POS_LONG, CLOSE_POS_SHORT]
+    BREAKOUT_THRESHOLDS: np.ndarray = field(init=False, repr=False, compare=False)
+
+    # 튜플 설정의 float64 배열 사본 (DCA/피라미딩 판정용, 읽기 전용)
+    DCA_LEVELS_ARR: np.ndarray = field(init=False, repr=False, compare=False)
+    DCA_MULTIPLIERS_ARR: np.ndarray = field(init=False, repr=False, compare=False)
+    TREND_PYRAMID_SIZES_ARR: np.ndarray = field(init=False, repr=False, compare=False)
+    _DCA_NEG_LEVELS: np.ndarray = field(init=False, repr=False, compare=False)
+
+    # 룩업 테이블 (if/elif 체인 대신 인덱스 1회로 조회)
+    # - SESSION_SIZE_MULT_BY_HOUR[hour]: UTC 시각별 세션 사이즈 배수 (겹치는 시간은 뒤 세션 우선: 미국 > 유럽 > 아시아, 세션 밖은 1.0, END < START면 자정을 넘는 세션)
+    # - LOSING_STREAK_MULT_LADDER[min(streak, LOSING_STREAK_STOP)]: 연패 수별 사이즈 배수 (STOP 이상은 0.0 = 거래 중단)
+    # - LIMIT_REQUOTE_OFFSETS[n]: n봉 대기 후 지정가 재호가 오프셋 (진입가 × (1 ± offset))
+    SESSION_SIZE_MULT_BY_HOUR: tuple = field(init=False, repr=False, compare=False)
+    LOSING_STREAK_MULT_LADDER: tuple = field(init=False, repr=False, compare=False)
+    LIMIT_REQUOTE_OFFSETS: tuple = field(init=False, repr=False, compare=False)
+
+    # 멤버십 체크용 (봉마다 hour in BLACKOUT_HOURS_SET, 주문마다 symbol in ALLOWED_SYMBOLS_SET)
+    ALLOWED_SYMBOLS_SET: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    BLACKOUT_HOURS_SET: FrozenSet[int] = field(init=False, repr=False, compare=False)
+
+    # 런타임 특화 함수 (USE_ATR_SLTP / DYNAMIC_LEVERAGE / FUNDING_ENABLED 분기를 로드 시 확정)
+    compute_sl_tp: object = field(init=False, repr=False, compare=False)
+    compute_leverage: object = field(init=False, repr=False, compare=False)
+    apply_funding: object = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # frozen이므로 파생 필드는 object.__setattr__로 1회만 채운다
+        object.__setattr__(self, "BREAKOUT", _group(self, BreakoutCfg, "BREAKOUT_"))
+        object.__setattr__(self, "HTF_TREND", _group(self, HtfTrendCfg, "HTF_TREND_"))
+        object.__setattr__(self, "CT_LONG", _ct_cfg(self, "LONG"))
+        object.__setattr__(self, "CT_SHORT", _ct_cfg(self, "SHORT"))
+
+        weights = np.array([
+            self.BREAKOUT_SCORE_W_ADX,
+            self.BREAKOUT_SCORE_W_VOL,
+            self.BREAKOUT_SCORE_W_CLOSE_POS,
+            self.BREAKOUT_SCORE_W_BREAK,
+            self.BREAKOUT_SCORE_W_ATR_EXP,
+        ], dtype=np.float32)
+        weights.setflags(write=False)
+        object.__setattr__(self, "BREAKOUT_SCORE_WEIGHTS", weights)
+
+        thresholds = np.array([
+            self.BREAKOUT_ATR_BREAK_MULT,
+            self.BREAKOUT_ATR_EXPANSION_MULT,
+            self.BREAKOUT_MIN_ADX,
+            self.BREAKOUT_SHORT_MIN_ADX,
+            self.BREAKOUT_CLOSE_POS_LONG,
+            self.BREAKOUT_CLOSE_POS_SHORT,
+        ], dtype=np.float32)
+        thresholds.setflags(write=False)
+        object.__setattr__(self, "BREAKOUT_THRESHOLDS", thresholds)
+
+        for name in ("DCA_LEVELS", "DCA_MULTIPLIERS", "TREND_PYRAMID_SIZES"):
+            arr = np.asarray(getattr(self, name), dtype=np.float64)
+            arr.setflags(write=False)
+            object.__setattr__(self, name + "_ARR", arr)
+        neg_levels = -self.DCA_LEVELS_ARR
+        neg_levels.setflags(write=False)
+        object.__setattr__(self, "_DCA_NEG_LEVELS", neg_levels)
+
+        by_hour = [1.0] * 24
+        for start, end, mult in (
+            (self.SESSION_ASIA_START, self.SESSION_ASIA_END, self.SESSION_ASIA_SIZE_MULT),
+            (self.SESSION_EUROPE_START, self.SESSION_EUROPE_END, self.SESSION_EUROPE_SIZE_MULT),
+            (self.SESSION_US_START, self.SESSION_US_END, self.SESSION_US_SIZE_MULT),
+        ):
+            # 자정을 넘는 세션(예: 22→2)은 end + 24까지 돌며 시각을 24로 접음
+            for hour in range(start, end if end >= start else end + 24):
+                by_hour[hour % 24] = mult
+        object.__setattr__(self, "SESSION_SIZE_MULT_BY_HOUR", tuple(by_hour))
+
+        ladder = []
+        for streak in range(self.LOSING_STREAK_STOP + 1):
+            if streak >= self.LOSING_STREAK_STOP:
+                ladder.append(0.0)
+            elif streak >= self.LOSING_STREAK_LEVEL2:
+                ladder.append(self.LOSING_STREAK_SIZE_MULT2)
+            elif streak >= self.LOSING_STREAK_THRESHOLD:
+                ladder.append(self.LOSING_STREAK_SIZE_MULT)
+            else:
+                ladder.append(1.0)
+        object.__setattr__(self, "LOSING_STREAK_MULT_LADDER", tuple(ladder))
+
+        step = self.LIMIT_REQUOTE_STEP_PCT if self.LIMIT_REQUOTE_EACH_BAR else 0.0
+        object.__setattr__(self, "LIMIT_REQUOTE_OFFSETS",
+                           tuple(n * step for n in range(self.LIMIT_MAX_WAIT_BARS + 1)))
+
+        object.__setattr__(self, "ALLOWED_SYMBOLS_SET", frozenset(self.ALLOWED_SYMBOLS))
+        object.__setattr__(self, "BLACKOUT_HOURS_SET", frozenset(self.BLACKOUT_HOURS))
+
+        object.__setattr__(self, "compute_sl_tp", _make_sl_tp(self))
+        object.__setattr__(self, "compute_leverage", _make_leverage(self))
+        object.__setattr__(self, "apply_funding", _make_funding(self))
+
+    def breakout_score(self, features):
+        """
+        돌파 점수 = 가중치 · [adx_n, vol_n, close_pos, brk, atr_exp]
+
+        features: 길이 5 벡터 → float 점수
+                  (N, 5) 행렬 → 길이 N 점수 배열 (백테스트 일괄 평가)
+        """
+        scores = np.asarray(features, dtype=np.float32) @ self.BREAKOUT_SCORE_WEIGHTS
+        return float(scores) if scores.ndim == 0 else scores
+
+    def dca_trigger_count(self, pnl_pct: float) -> int:
+        """
+        현재 손익률(pnl_pct)이 도달한 DCA 레벨 수 (0 = 아직 없음, DCA_MAX_ENTRIES 상한)
+        DCA_LEVELS는 내림차순 음수이므로 부호를 뒤집어 searchsorted 1회로 판정
+        """
+        n = int(np.searchsorted(self._DCA_NEG_LEVELS, -pnl_pct, side="right"))
+        return min(n, self.DCA_MAX_ENTRIES)
+
+    def breakout_masks(self, delta_high, delta_low, atr, atr_avg, adx, close_pos):
+        """
+        돌파 조건을 봉 배열 전체에 한 번에 적용 → (long_ok, short_ok) bool 배열
+
+        delta_high: high - 직전 고점 레벨 / delta_low: 직전 저점 레벨 - low
+        atr_avg: 최근 BREAKOUT_ATR_EXPANSION_LOOKBACK 봉 평균 ATR
+        """
+        t = self.BREAKOUT_THRESHOLDS
+        atr = np.asarray(atr, dtype=np.float32)
+        adx = np.asarray(adx, dtype=np.float32)
+        close_pos = np.asarray(close_pos, dtype=np.float32)
+        brk = atr * t[0]
+        expanding = atr > np.asarray(atr_avg, dtype=np.float32) * t[1]
+        long_ok = (np.asarray(delta_high) >= brk) & expanding & (adx >= t[2]) & (close_pos >= t[4])
+        short_ok = (np.asarray(delta_low) >= brk) & expanding & (adx >= t[3]) & (close_pos <= t[5])
+        return long_ok, short_ok
+
     # ============================================================
     # [계산된 파생 값]
     # ============================================================
     @property
     def kelly_full(self) -> float:
         """Full Kelly Criterion"""
-        return WIN_RATE - (1 - WIN_RATE) / RISK_REWARD
+        return KELLY_FULL
     
     @property
     def kelly_half(self) -> float:
         """Half Kelly (권장)"""
-        return self.kelly_full / 2
+        return KELLY_HALF
     
     @property
     def edge(self) -> float:
         """기대 수익률 (edge)"""
-        return WIN_RATE * RISK_REWARD - (1 - WIN_RATE)
+        return EDGE
     
     @property
     def min_rr_ratio(self) -> float:
@@ -812,35 +1226,56 @@ class TradingSettings(BaseSettings):
         return PYRAMID_DECAY
     
     # ============================================================
-    # Pydantic Config
+    # 환경변수 로드
     # ============================================================
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding='utf-8',
-        extra='ignore'
-    )
+    @classmethod
+    def from_env(cls, env_file: str = ".env") -> "TradingSettings":
+        """
+        .env + os.environ을 1회 읽어 인스턴스 생성
+        - 우선순위: os.environ > .env > 기본값
+        - 키는 대소문자 무시, 모르는 키는 무시
+        """
+        env = {}
+        if os.path.exists(env_file):
+            from dotenv import dotenv_values  # .env가 있을 때만 로드
+            env.update({k.upper(): v for k, v in dotenv_values(env_file).items() if v is not None})
+        env.update({k.upper(): v for k, v in os.environ.items()})
+
+        return cls(**{name: cast(env[name]) for name, cast in _ENV_FIELDS if name in env})
+
+
+# 환경변수로 덮어쓸 수 있는 필드의 (이름, 변환 함수) 테이블 - 클래스 정의 시 1회 생성
+_ENV_FIELDS: Tuple[tuple, ...] = tuple((f.name, _caster(f.type, f.name)) for f in fields(TradingSettings) if f.init)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> TradingSettings:
+    """프로세스당 1개의 불변 설정 인스턴스 (재호출 시 env 파싱 없이 그대로 반환)"""
+    return TradingSettings.from_env()
 
 
 # 설정 인스턴스
-settings = TradingSettings()
-
-# 계산된 값 출력
-print(f"[OK] 설정 로드: {settings.APP_NAME}")
-print(f"=" * 60)
-print(f"[수학적 최적화 파라미터]")
-print(f"   승률 가정     : {WIN_RATE*100:.0f}%")
-print(f"   손익비        : {RISK_REWARD:.1f}:1")
-print(f"   Full Kelly    : {settings.kelly_full*100:.2f}%")
-print(f"   Half Kelly    : {settings.kelly_half*100:.2f}%")
-print(f"   Edge          : {settings.edge*100:.2f}%")
-print(f"   BEP 손익비    : {settings.min_rr_ratio:.2f}:1")
-print(f"   99% 연패한계  : {settings.losing_streak_99pct}연패")
-print(f"   유의 거래수   : {settings.min_trades_statistical}회")
-print(f"   피라미딩 감소 : {settings.optimal_pyramid_decay:.2f}")
-print(f"=" * 60)
-print(f"[리스크 설정]")
-print(f"   일일 DD 한계  : {settings.MAX_DAILY_DRAWDOWN*100:.0f}%")
-print(f"   총 DD 한계    : {settings.MAX_TOTAL_DRAWDOWN*100:.0f}%")
-print(f"   포지션 한계   : {settings.MAX_POSITION_SIZE*100:.0f}%")
-print(f"   ATR SL/TP     : {settings.ATR_SL_MULT:.1f} / {settings.ATR_TP_MULT:.1f} ATR")
-print(f"=" * 60)
+settings = get_settings()
+
+# 계산된 값 출력 (한 번에 조립해서 1회 출력)
+print("\n".join((
+    f"[OK] 설정 로드: {settings.APP_NAME}",
+    "=" * 60,
+    "[수학적 최적화 파라미터]",
+    f"   승률 가정     : {WIN_RATE*100:.0f}%",
+    f"   손익비        : {RISK_REWARD:.1f}:1",
+    f"   Full Kelly    : {settings.kelly_full*100:.2f}%",
+    f"   Half Kelly    : {settings.kelly_half*100:.2f}%",
+    f"   Edge          : {settings.edge*100:.2f}%",
+    f"   BEP 손익비    : {settings.min_rr_ratio:.2f}:1",
+    f"   99% 연패한계  : {settings.losing_streak_99pct}연패",
+    f"   유의 거래수   : {settings.min_trades_statistical}회",
+    f"   피라미딩 감소 : {settings.optimal_pyramid_decay:.2f}",
+    "=" * 60,
+    "[리스크 설정]",
+    f"   일일 DD 한계  : {settings.MAX_DAILY_DRAWDOWN*100:.0f}%",
+    f"   총 DD 한계    : {settings.MAX_TOTAL_DRAWDOWN*100:.0f}%",
+    f"   포지션 한계   : {settings.MAX_POSITION_SIZE*100:.0f}%",
+    f"   ATR SL/TP     : {settings.ATR_SL_MULT:.1f} / {settings.ATR_TP_MULT:.1f} ATR",
+    "=" * 60,
+)))
@@ -0,0 +1,25 @@
+# AOT build for core/indicators_njit kernels
+"""
+numba.pycc로 Wilder ATR/ADX 커널을 공유 라이브러리(core/_indicators_aot.*.so)로 미리 컴파일한다.
+프로세스 시작 시 JIT 컴파일/캐시 로드 없이 바로 import 된다.
+
+    cd python_brain && python -m core._indicators_aot_build
+
+빌드 산출물이 없으면 indicators_njit가 njit(cache=True) → 순수 파이썬 순으로 폴백한다.
+"""
+import os
+
+from numba.pycc import CC
+
+from core.indicators_njit import _wilder_atr_adx
+
+cc = CC("_indicators_aot")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export("wilder_atr_adx", "UniTuple(f8, 2)(f8[:], f8[:], f8[:], i8)")(
+    getattr(_wilder_atr_adx, "py_func", _wilder_atr_adx)
+)
+
+
+if __name__ == "__main__":
+    cc.compile()
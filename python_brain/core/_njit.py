@@ -0,0 +1,15 @@
+# numba optional shim
+"""
+numba가 있으면 njit을 그대로 쓰고, 없으면 원본 함수를 돌려주는 no-op 데코레이터
+(커널 코드는 두 경우 모두 같은 결과를 내야 한다)
+"""
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
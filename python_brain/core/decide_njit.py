@@ -0,0 +1,156 @@
+# Fused regime + strategy signal kernel (numba optional)
+"""
+[틱 단위 판단 커널]
+
+detect_regime + 해당 regime 풀의 전략 generate(breakout / trend / mean_reversion)를
+스칼라 인자만 받는 njit 함수 하나로 합친다. 틱마다 전략 객체 3개를 거치는
+파이썬 호출/속성 조회가 사라지고 공통 조건(atr_pct, adx 비교)은 한 번만 평가된다.
+
+core/strategies/*의 generate가 기준 구현이며 이 커널은 같은 값을 내야 한다.
+전략 파라미터는 strategy_params(전략 인스턴스들)로 배열에 담아 인자로 넘긴다
+(전역 상수로 두면 cache=True 캐시에 옛 값이 굳는다).
+"""
+import numpy as np
+
+from core._njit import njit
+from core.strategies.breakout import BreakoutStrategy
+from core.strategies.trend import TrendStrategy
+from core.strategies.mean_reversion import MeanReversionStrategy
+
+# regime 코드 (core.regime.REGIME_BY_CODE 순서)
+_TREND, _CHOP, _DISTRIBUTION, _SQUEEZE = 0, 1, 2, 3
+
+
+@njit(cache=True)
+def _breakout_signal(price, atr_value, atr_pct, adx, ema_fast, ema_slow, volume_z, funding, p):
+    min_adx, min_atr_pct, min_volume_z = p[0], p[1], p[2]
+    if adx < min_adx or atr_pct < min_atr_pct or volume_z < min_volume_z:
+        return 0.0, 0.0, 0.0
+    adx_bonus = min((adx - p[9]) * p[7], 1.0)
+    volume_bonus = min((volume_z - 1.0) * p[8], 0.5)
+    tp_mult = min(p[5] + adx_bonus + volume_bonus, p[6])
+    sl_mult = p[4] if atr_pct > 0.015 else p[3]
+
+    sign = 0.0
+    if ema_fast > 0.0005 and ema_slow > 0:
+        if funding <= 0.0003:
+            sign = 1.0
+    elif ema_fast < -0.0005 and ema_slow < 0:
+        if funding >= -0.0003:
+            sign = -1.0
+    if sign == 0.0:
+        return 0.0, 0.0, 0.0
+    return sign, price - sign * atr_value * sl_mult, price + sign * atr_value * tp_mult
+
+
+@njit(cache=True)
+def _trend_signal(price, atr_value, atr_pct, adx, ema_fast, ema_slow, funding, ret_1, ret_5, p):
+    if adx < p[0] or atr_pct < p[1]:
+        return 0.0, 0.0, 0.0
+    funding_long = funding < -0.0001
+    funding_short = funding > 0.0002
+
+    tp_mult = p[4]
+    if adx > p[2]:
+        tp_mult += 1.0
+    if funding_long or funding_short:
+        tp_mult += 0.5
+    tp_mult = min(tp_mult, p[5])
+
+    sign = 0.0
+    favored = False
+    if ema_fast > 0.001 and ema_slow > 0:
+        if (ret_1 > 0 and ret_5 > 0) or funding_long:
+            sign = 1.0
+        favored = funding_long
+    elif ema_fast < -0.001 and ema_slow < 0:
+        if (ret_1 < 0 and ret_5 < 0) or funding_short:
+            sign = -1.0
+        favored = funding_short
+    if sign == 0.0:
+        return 0.0, 0.0, 0.0
+    sl_mult = 2.0 if favored else p[3]
+    return sign, price - sign * atr_value * sl_mult, price + sign * atr_value * tp_mult
+
+
+@njit(cache=True)
+def _mean_reversion_signal(price, atr_value, atr_pct, adx, volume_z, ret_1, ret_5, p):
+    if adx > p[0] or volume_z > p[1] or atr_pct < p[2]:
+        return 0.0, 0.0, 0.0
+    volume_boost = volume_z > 1.2
+
+    sign = 0.0
+    is_strong = False
+    if ret_5 < p[3]:
+        is_strong = ret_5 < p[4] and ret_1 < -0.005
+        if is_strong or volume_boost or ret_1 < -0.003:
+            sign = 1.0
+    elif ret_5 > p[5]:
+        is_strong = ret_5 > p[6] and ret_1 > 0.005
+        if is_strong or volume_boost or ret_1 > 0.003:
+            sign = -1.0
+    if sign == 0.0:
+        return 0.0, 0.0, 0.0
+    tp_mult = p[9] if is_strong else p[8]
+    return sign, price - sign * atr_value * p[7], price + sign * atr_value * tp_mult
+
+
+@njit(cache=True)
+def decide(price, atr_pct, atr_value, adx, ema_fast, ema_slow, volume_z, funding, ret_1, ret_5,
+           breakout_p, trend_p, mean_reversion_p, out):
+    """
+    MarketFeatures 필드 순서의 스칼라 → regime 코드
+
+    out: (3, 3) float64, STRATEGY_IDS 행마다 [sign, stop, target]
+         sign +1 롱 / -1 숏 / 0 신호 없음 (regime 풀에 없는 전략도 0)
+    """
+    out[:, :] = 0.0
+
+    # detect_regime과 같은 우선순위
+    if atr_pct < 0.006 and adx < 18:
+        return _CHOP
+    if atr_pct > 0.015 and volume_z > 1.2:
+        return _SQUEEZE
+    if adx > 22:
+        out[0, 0], out[0, 1], out[0, 2] = _breakout_signal(
+            price, atr_value, atr_pct, adx, ema_fast, ema_slow, volume_z, funding, breakout_p)
+        out[1, 0], out[1, 1], out[1, 2] = _trend_signal(
+            price, atr_value, atr_pct, adx, ema_fast, ema_slow, funding, ret_1, ret_5, trend_p)
+        return _TREND
+    out[2, 0], out[2, 1], out[2, 2] = _mean_reversion_signal(
+        price, atr_value, atr_pct, adx, volume_z, ret_1, ret_5, mean_reversion_p)
+    return _DISTRIBUTION
+
+
+# ============================================================
+# [전략 파라미터 → 배열]
+# ============================================================
+def strategy_params(b=None, t=None, m=None):
+    """
+    b/t/m: Breakout/Trend/MeanReversion 인스턴스 (생략 시 기본 파라미터)
+
+    Returns:
+        (breakout_p, trend_p, mean_reversion_p) - decide 인자용 float64 배열
+    """
+    b = b or BreakoutStrategy()
+    t = t or TrendStrategy()
+    m = m or MeanReversionStrategy()
+    breakout_p = np.array([
+        b.MIN_ADX, b.MIN_ATR_PCT, b.MIN_VOLUME_Z, b.BASE_SL_ATR, b.HIGH_VOL_SL_ATR,
+        b.BASE_TP_ATR, b.MAX_TP_ATR, b.ADX_BONUS_SCALE, b.VOLUME_BONUS_SCALE,
+        b.ADX_BONUS_BASE,
+    ], dtype=np.float64)
+    trend_p = np.array([
+        t.MIN_ADX, t.MIN_ATR_PCT, t.STRONG_ADX, t.BASE_SL_ATR, t.BASE_TP_ATR, t.MAX_TP_ATR,
+    ], dtype=np.float64)
+    mean_reversion_p = np.array([
+        m.MAX_ADX, m.MAX_VOLUME_Z, m.MIN_ATR_PCT, m.WEAK_DIP, m.STRONG_DIP,
+        m.WEAK_PUMP, m.STRONG_PUMP, m.BASE_SL_ATR, m.WEAK_TP_ATR, m.STRONG_TP_ATR,
+    ], dtype=np.float64)
+    return breakout_p, trend_p, mean_reversion_p
+
+
+def warmup():
+    """시작 시 1회 호출해 JIT 컴파일 비용을 루프 밖으로 뺀다"""
+    decide(100.0, 0.01, 1.0, 25.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0,
+           *strategy_params(), np.zeros((3, 3), dtype=np.float64))
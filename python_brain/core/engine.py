@@ -1,4 +1,11 @@
-from core.regime import detect_regime, MarketRegime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from core._njit import HAS_NUMBA
+from core.decide_njit import decide, strategy_params
+from core.regime import detect_regime, MarketRegime, REGIME_BY_CODE
 from core.ev_estimator import EVEstimator
 from core.history_store import StrategyHistoryStore
 from core.selector import select_best
@@ -8,43 +15,108 @@ from core.strategies.breakout import BreakoutStrategy
 from core.strategies.trend import TrendStrategy
 from core.strategies.mean_reversion import MeanReversionStrategy
 
+# 전략 이름 → 쿨다운 배열 인덱스
+STRATEGY_IDS = {"breakout": 0, "trend": 1, "mean_reversion": 2}
+_COOLDOWN_MAX = np.iinfo(np.int8).max
+
+# regime → [(strategy id, strategy)]
 REGIME_POOL = {
-    MarketRegime.TREND: [BreakoutStrategy(), TrendStrategy()],
-    MarketRegime.DISTRIBUTION: [MeanReversionStrategy()],
+    MarketRegime.TREND: [(STRATEGY_IDS["breakout"], BreakoutStrategy()), (STRATEGY_IDS["trend"], TrendStrategy())],
+    MarketRegime.DISTRIBUTION: [(STRATEGY_IDS["mean_reversion"], MeanReversionStrategy())],
     MarketRegime.SQUEEZE: [],
     MarketRegime.CHOP: [],
 }
 
 class TradingEngine:
-    def __init__(self):
+    def __init__(self, workers: int = 0, fused: Optional[bool] = None):
+        """
+        Args:
+            workers: >0이면 한 틱의 전략 generate를 스레드 풀에서 동시에 실행 (0: 순차 실행)
+            fused: True면 regime 판정 + 전략 신호를 njit 커널(core.decide_njit) 한 번으로 계산
+                   (전략 객체 generate_cached를 거치지 않음)
+                   None이면 numba 설치 + workers=0일 때 사용
+        
+        Raises:
+            ValueError: fused=True와 workers>0을 함께 지정 (커널 경로는 스레드 풀을 쓰지 않음)
+        """
+        if fused is None:
+            fused = HAS_NUMBA and workers == 0
+        elif fused and workers > 0:
+            raise ValueError("fused=True does not use a strategy thread pool; pass workers=0")
         self.ev = EVEstimator()
         self.history = StrategyHistoryStore()
-        self.cooldown = {}  # strategy: remaining bars
+        self.cooldown = np.zeros(len(STRATEGY_IDS), dtype=np.int8)  # STRATEGY_IDS 순서: remaining bars
+        # (strategy, regime) → (history generation, funding, StrategyStats)
+        # 거래가 추가되지 않았고 펀딩비가 같으면 EV 재추정 생략
+        self._stats_cache = {}
+        self._fused = fused
+        pool = {s.name: s for entries in REGIME_POOL.values() for _, s in entries}
+        self._params = strategy_params(pool["breakout"], pool["trend"], pool["mean_reversion"])
+        self._signals = np.zeros((len(STRATEGY_IDS), 3), dtype=np.float64)  # STRATEGY_IDS 행: [sign, stop, target]
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="strategy") if workers > 0 else None
 
     def on_trade_close(self, strategy, regime, pnl):
-        self.history.add(strategy, regime, {"pnl": pnl})
+        self.history.add(strategy, regime, float(pnl))
         if pnl < 0:
-            self.cooldown[strategy] = self.cooldown.get(strategy, 0) + 3
+            # 이력은 이름 그대로 기록, 쿨다운은 STRATEGY_IDS에 있는 전략만 (모르는/이전 라벨은 건너뜀)
+            sid = STRATEGY_IDS.get(strategy)
+            if sid is not None:
+                self.cooldown[sid] = min(int(self.cooldown[sid]) + 3, _COOLDOWN_MAX)
 
-    def step(self, features, equity):
+    def _estimate(self, strategy, regime, funding):
+        key = (strategy, regime)
+        gen = self.history.generation(strategy, regime)
+        cached = self._stats_cache.get(key)
+        if cached is not None and cached[0] == gen and cached[1] == funding:
+            return cached[2]
+
+        trades = self.history.get(strategy, regime)
+        stat = self.ev.estimate(strategy, regime, trades, funding)
+        self._stats_cache[key] = (gen, funding, stat)
+        return stat
+
+    def _step_strategies(self, features):
+        """전략 객체 generate 경로 → (regime, 신호가 난 전략 목록)"""
         regime = detect_regime(features)
         strategies = REGIME_POOL.get(regime, [])
-        stats = []
+        active = []
 
-        for s in strategies:
-            if self.cooldown.get(s.name, 0) > 0:
-                self.cooldown[s.name] -= 1
+        for sid, s in strategies:
+            if self.cooldown[sid] > 0:
+                self.cooldown[sid] -= 1
                 continue
+            active.append(s)
+
+        # 전략은 순수 함수 → 동시에 실행해도 결과 동일, 수집은 REGIME_POOL 순서 유지
+        if self._pool is not None and len(active) > 1:
+            futures = [self._pool.submit(s.generate_cached, features) for s in active]
+            signals = [fut.result() for fut in futures]
+        else:
+            signals = [s.generate_cached(features) for s in active]
+
+        return regime, [s for s, signal in zip(active, signals) if signal]
 
-            signal = s.generate(features)
-            if not signal:
+    def _step_fused(self, f):
+        """decide 커널 1회 호출 → (regime, 신호가 난 전략 목록)"""
+        code = decide(f.price, f.atr_pct, f.atr_value, f.adx, f.ema_fast_slope, f.ema_slow_slope,
+                      f.volume_z, f.funding_rate, f.ret_1, f.ret_5, *self._params, self._signals)
+        regime = REGIME_BY_CODE[code]
+        fired = []
+        for sid, s in REGIME_POOL.get(regime, []):
+            if self.cooldown[sid] > 0:
+                self.cooldown[sid] -= 1
                 continue
+            if self._signals[sid, 0] != 0:
+                fired.append(s)
+        return regime, fired
+
+    def step(self, features, equity):
+        if self._fused:
+            regime, fired = self._step_fused(features)
+        else:
+            regime, fired = self._step_strategies(features)
 
-            trades = self.history.get(s.name, regime.value)
-            stat = self.ev.estimate(
-                s.name, regime.value, trades, features.funding_rate
-            )
-            stats.append(stat)
+        stats = [self._estimate(s.name, regime.value, features.funding_rate) for s in fired]
 
         best = select_best(stats)
         if not best:
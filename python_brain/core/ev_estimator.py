@@ -7,8 +7,24 @@
 3. 수수료/펀딩비 정밀 차감
 4. 신뢰구간 계산
 """
+from functools import lru_cache
+from typing import Optional
+
 from core.types import StrategyStats
-import math
+
+import numpy as np
+
+
+@lru_cache(maxsize=64)
+def _ewma_weights(alpha: float, n: int) -> np.ndarray:
+    """
+    ewma = pnl[0], ewma = α·pnl + (1-α)·ewma 재귀를 펼친 가중치
+    w[i] = α(1-α)^(n-1-i), 단 첫 값은 초기값이므로 w[0] = (1-α)^(n-1)
+    """
+    w = alpha * (1 - alpha) ** np.arange(n - 1, -1, -1, dtype=np.float64)
+    w[0] = (1 - alpha) ** (n - 1)
+    w.setflags(write=False)
+    return w
 
 
 class EVEstimator:
@@ -16,13 +32,17 @@ class EVEstimator:
     기대수익(Expected Value) 추정기
     """
     
+    def __init__(self, fee: float = 0.0004):  # 0.04% (maker+taker 평균)
+        self.fee = fee
+        self._fee2 = fee * 2  # 진입 + 청산 왕복 수수료 (호출마다 재계산하지 않음)
+    
     def estimate(
         self,
         strategy: str,
         regime: str,
-        trades: list,
+        trades,
         funding: float,
-        fee: float = 0.0004,  # 0.04% (maker+taker 평균)
+        fee: Optional[float] = None,  # None이면 생성 시 fee 사용
         alpha: float = 0.25,  # 최근 거래 가중치 (높을수록 최근 중시)
         min_trades: int = 15  # 최소 거래 수 (너무 낮으면 노이즈)
     ) -> StrategyStats:
@@ -32,9 +52,9 @@ class EVEstimator:
         Args:
             strategy: 전략 이름
             regime: 시장 상태
-            trades: 과거 거래 기록 [{"pnl": float}, ...]
+            trades: 과거 거래 PnL 배열 (시간순, StrategyHistoryStore.get)
             funding: 펀딩비
-            fee: 수수료
+            fee: 수수료 (생략 시 생성자 값)
             alpha: EWMA 알파 (최근 가중치)
             min_trades: 최소 거래 수
         
@@ -46,25 +66,26 @@ class EVEstimator:
             return StrategyStats(strategy, regime, 0, 0, 0, -1, 0)
         
         # 2. PnL 추출
-        pnl_list = [float(t.get("pnl", 0)) for t in trades]
+        pnl = np.asarray(trades, dtype=np.float64)
+        n = len(pnl)
         
         # 3. EWMA 계산 (최근 거래에 가중치)
-        ewma = pnl_list[0]
-        for pnl in pnl_list[1:]:
-            ewma = alpha * pnl + (1 - alpha) * ewma
+        ewma = float(pnl @ _ewma_weights(alpha, n))
         
         # 4. 승/패 분리
-        wins = [pnl for pnl in pnl_list if pnl > 0]
-        losses = [pnl for pnl in pnl_list if pnl <= 0]
+        win_mask = pnl > 0
+        n_wins = int(np.count_nonzero(win_mask))
+        n_losses = n - n_wins
         
-        win_rate = len(wins) / len(pnl_list)
-        avg_win = sum(wins) / len(wins) if wins else 0
-        avg_loss = abs(sum(losses) / len(losses)) if losses else 0
+        win_rate = n_wins / n
+        avg_win = float(pnl[win_mask].mean()) if n_wins else 0
+        avg_loss = abs(float(pnl[~win_mask].mean())) if n_losses else 0
         
         # 5. 비용 차감
         # - 수수료: 진입 + 청산 = 2회
         # - 펀딩비: 절대값 (항상 비용으로 가정)
-        total_cost = (fee * 2) + abs(funding)
+        fee2 = self._fee2 if fee is None else fee * 2
+        total_cost = fee2 + abs(funding)
         
         # 6. 최종 EV 계산
         ev = ewma - total_cost
@@ -74,10 +95,9 @@ class EVEstimator:
         trade_confidence = min(1.0, len(trades) / 100)
         
         # - 일관성 기반 (표준편차가 낮으면 높은 신뢰도)
-        if len(pnl_list) > 5:
-            mean_pnl = sum(pnl_list) / len(pnl_list)
-            variance = sum((p - mean_pnl) ** 2 for p in pnl_list) / len(pnl_list)
-            std_pnl = math.sqrt(variance)
+        if n > 5:
+            mean_pnl = float(pnl.mean())
+            std_pnl = float(pnl.std())
             # 표준편차가 평균의 2배 이하면 일관성 높음
             consistency = 1.0 / (1 + std_pnl / (abs(mean_pnl) + 0.0001))
         else:
@@ -0,0 +1,33 @@
+# Per-bar scoring kernels (numba optional)
+"""
+[봉 단위 점수 커널]
+
+백테스트 루프에서 봉마다 호출되는 가중합 점수를 스칼라 인자만 받는
+순수 함수로 분리한다. numba가 설치되어 있으면 njit으로 컴파일되고,
+없으면 같은 코드가 일반 파이썬 함수로 동작한다.
+
+settings 객체는 nopython 모드에 넘길 수 없으므로
+루프 시작 전에 breakout_weights()로 가중치를 한 번 꺼내 값으로 전달한다.
+"""
+from core._njit import njit
+
+
+_JIT = dict(cache=True, fastmath=True, boundscheck=False)
+
+
+@njit(**_JIT)
+def breakout_score(adx_n, vol_n, pos, brk, atr_exp,
+                   w_adx, w_vol, w_pos, w_brk, w_atr):
+    return w_adx * adx_n + w_vol * vol_n + w_pos * pos + w_brk * brk + w_atr * atr_exp
+
+
+# ============================================================
+# [settings → 스칼라 파라미터]
+# ============================================================
+def breakout_weights(s):
+    return tuple(float(w) for w in s.BREAKOUT_SCORE_WEIGHTS)
+
+
+def warmup():
+    """시작 시 1회 호출해 JIT 컴파일 비용을 루프 밖으로 뺀다"""
+    breakout_score(0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0, 1.0)
@@ -1,7 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
-@dataclass
+import numpy as np
+
+@dataclass(slots=True, frozen=True)
 class MarketFeatures:
+    """봉 1개의 특징값 (불변 + 해시 가능 → 전략 결과 캐시 키로 사용)"""
     price: float
     atr_pct: float
     atr_value: float  # ATR in price units (e.g., $500)
@@ -12,3 +15,46 @@ class MarketFeatures:
     funding_rate: float
     ret_1: float
     ret_5: float
+
+# 대량 백테스트용 packed 레코드 (필드당 float32, 행당 40B)
+FEAT_DTYPE = np.dtype([(f.name, np.float32) for f in fields(MarketFeatures)])
+
+def to_feature_array(items) -> np.ndarray:
+    """MarketFeatures 시퀀스 → FEAT_DTYPE 구조화 배열"""
+    items = list(items)
+    arr = np.empty(len(items), dtype=FEAT_DTYPE)
+    for name in FEAT_DTYPE.names:
+        arr[name] = [getattr(x, name) for x in items]
+    return arr
+
+@dataclass(slots=True)
+class MarketFeaturesBatch:
+    """
+    MarketFeatures의 SoA 버전 - 필드마다 길이 N 배열 (심볼/봉 일괄 평가용)
+    from_features: float64 사본 / from_array: FEAT_DTYPE 레코드의 float32 열 뷰 (복사 없음)
+    """
+    price: np.ndarray
+    atr_pct: np.ndarray
+    atr_value: np.ndarray
+    adx: np.ndarray
+    ema_fast_slope: np.ndarray
+    ema_slow_slope: np.ndarray
+    volume_z: np.ndarray
+    funding_rate: np.ndarray
+    ret_1: np.ndarray
+    ret_5: np.ndarray
+
+    @classmethod
+    def from_features(cls, items) -> "MarketFeaturesBatch":
+        items = list(items)
+        return cls(**{
+            f.name: np.fromiter((getattr(x, f.name) for x in items), dtype=np.float64, count=len(items))
+            for f in fields(MarketFeatures)
+        })
+
+    @classmethod
+    def from_array(cls, arr: np.ndarray) -> "MarketFeaturesBatch":
+        return cls(**{name: arr[name] for name in FEAT_DTYPE.names})
+
+    def __len__(self) -> int:
+        return len(self.price)
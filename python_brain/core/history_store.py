@@ -1,12 +1,48 @@
-from collections import defaultdict, deque
+from collections import defaultdict
+
+import numpy as np
+
+class _PnlRing:
+    """
+    고정 길이 PnL 링버퍼 (maxlen 초과분은 오래된 것부터 덮어씀)
+    - 각 값을 buf[i], buf[i + maxlen] 두 곳에 기록해
+      항상 buf[start:start + n]이 시간순 연속 뷰가 되도록 한다 (get 시 복사 없음)
+    """
+    __slots__ = ("buf", "maxlen", "idx", "n", "gen")
+
+    def __init__(self, maxlen: int):
+        self.buf = np.zeros(maxlen * 2, dtype=np.float64)
+        self.maxlen = maxlen
+        self.idx = 0  # 다음 기록 위치 (0 ~ maxlen-1)
+        self.n = 0
+        self.gen = 0  # append마다 증가 (캐시 무효화용)
+
+    def append(self, pnl: float):
+        i = self.idx
+        self.buf[i] = self.buf[i + self.maxlen] = pnl
+        self.idx = (i + 1) % self.maxlen
+        if self.n < self.maxlen:
+            self.n += 1
+        self.gen += 1
+
+    def view(self) -> np.ndarray:
+        start = self.idx if self.n == self.maxlen else 0
+        v = self.buf[start:start + self.n]
+        v.flags.writeable = False
+        return v
 
 class StrategyHistoryStore:
     def __init__(self, maxlen: int = 100):
-        self.store = defaultdict(lambda: deque(maxlen=maxlen))
+        self.store = defaultdict(lambda: _PnlRing(maxlen))
 
-    def add(self, strategy: str, regime: str, trade: dict):
+    def add(self, strategy: str, regime: str, pnl: float):
         key = f"{strategy}:{regime}"
-        self.store[key].append(trade)
+        self.store[key].append(pnl)
+
+    def get(self, strategy: str, regime: str) -> np.ndarray:
+        """시간순 PnL 배열 (읽기 전용 뷰 - 다음 add 전까지 유효)"""
+        return self.store[f"{strategy}:{regime}"].view()
 
-    def get(self, strategy: str, regime: str):
-        return list(self.store[f"{strategy}:{regime}"])
+    def generation(self, strategy: str, regime: str) -> int:
+        """해당 키에 거래가 추가될 때마다 바뀌는 값 (같으면 get 결과도 같음)"""
+        return self.store[f"{strategy}:{regime}"].gen
@@ -0,0 +1,88 @@
+# Wilder ATR/ADX kernel (numba optional)
+"""
+[Wilder 평활 ATR / ADX]
+
+재귀 평활(α = 1/period)은 본질적으로 순차 루프라 벡터화가 안 되므로
+스칼라 루프 그대로 njit 컴파일한다 (numba 미설치 시 같은 코드가 파이썬으로 동작).
+
+우선순위: AOT 빌드 모듈(core/_indicators_aot, 컴파일 대기 없음) > njit(cache=True) > 순수 파이썬
+AOT 빌드: python -m core._indicators_aot_build
+"""
+import numpy as np
+
+from core._njit import njit
+
+
+@njit(cache=True)
+def _wilder_atr_adx(high, low, close, period):
+    """
+    high/low/close: float64 배열 (시간순, 길이 n > period)
+
+    Returns:
+        (atr, adx) - ATR: TR의 Wilder 평활, ADX: DX의 Wilder 평활
+        DX가 period개보다 적으면 ADX는 DX 평균
+    """
+    n = high.shape[0]
+    tr_s = 0.0
+    pdm_s = 0.0
+    mdm_s = 0.0
+    atr = 0.0
+    adx = 0.0
+    dx_sum = 0.0
+    dx_n = 0
+
+    for i in range(1, n):
+        h = high[i]
+        l = low[i]
+        pc = close[i - 1]
+        tr = max(h - l, abs(h - pc), abs(l - pc))
+        up = h - high[i - 1]
+        down = low[i - 1] - l
+        pdm = up if (up > down and up > 0.0) else 0.0
+        mdm = down if (down > up and down > 0.0) else 0.0
+
+        if i <= period:
+            # 초기 구간: 단순 합으로 시드
+            tr_s += tr
+            pdm_s += pdm
+            mdm_s += mdm
+            atr = tr_s / i
+            if i < period:
+                continue
+        else:
+            tr_s = tr_s - tr_s / period + tr
+            pdm_s = pdm_s - pdm_s / period + pdm
+            mdm_s = mdm_s - mdm_s / period + mdm
+            atr = (atr * (period - 1) + tr) / period
+
+        plus_di = 100.0 * pdm_s / max(tr_s, 1e-12)
+        minus_di = 100.0 * mdm_s / max(tr_s, 1e-12)
+        dx = 100.0 * abs(plus_di - minus_di) / max(plus_di + minus_di, 1e-12)
+
+        if dx_n < period:
+            dx_sum += dx
+            dx_n += 1
+            adx = dx_sum / dx_n
+        else:
+            adx = (adx * (period - 1) + dx) / period
+
+    return atr, adx
+
+
+try:
+    from core._indicators_aot import wilder_atr_adx as _aot_wilder_atr_adx
+except ImportError:
+    _aot_wilder_atr_adx = None
+
+_kernel = _aot_wilder_atr_adx or _wilder_atr_adx
+
+
+def wilder_atr_adx(high, low, close, period=14):
+    """(atr, adx) - 커널 선택은 모듈 docstring 참고"""
+    return _kernel(high, low, close, period)
+
+
+def warmup():
+    """시작 시 1회 호출해 JIT 컴파일 비용을 루프 밖으로 뺀다"""
+    x = np.linspace(1.0, 2.0, 32)
+    wilder_atr_adx(x + 0.01, x - 0.01, x, 14)
@@ -1,5 +1,9 @@
 from enum import Enum
-from core.features import MarketFeatures
+from functools import lru_cache
+
+import numpy as np
+
+from core.features import MarketFeatures, MarketFeaturesBatch
 
 class MarketRegime(Enum):
     TREND = "trend"
@@ -7,11 +11,36 @@ class MarketRegime(Enum):
     DISTRIBUTION = "distribution"
     SQUEEZE = "squeeze"
 
-def detect_regime(f: MarketFeatures) -> MarketRegime:
-    if f.atr_pct < 0.006 and f.adx < 18:
+# detect_regime_batch 결과 코드 → MarketRegime (REGIME_BY_CODE[code])
+REGIME_BY_CODE = (MarketRegime.TREND, MarketRegime.CHOP, MarketRegime.DISTRIBUTION, MarketRegime.SQUEEZE)
+REGIME_CODE = {r: i for i, r in enumerate(REGIME_BY_CODE)}
+
+@lru_cache(maxsize=None)
+def _regime_from_bins(atr_b: int, adx_b: int, vol_b: int) -> MarketRegime:
+    """
+    임계값 기준 구간 → regime (구간 경계가 임계값과 같아서 양자화 오차 없음)
+    atr_b: 0 (<0.006) / 1 / 2 (>0.015), adx_b: 0 (<18) / 1 / 2 (>22), vol_b: 0 / 1 (>1.2)
+    """
+    if atr_b == 0 and adx_b == 0:
         return MarketRegime.CHOP
-    if f.atr_pct > 0.015 and f.volume_z > 1.2:
+    if atr_b == 2 and vol_b == 1:
         return MarketRegime.SQUEEZE
-    if f.adx > 22:
+    if adx_b == 2:
         return MarketRegime.TREND
     return MarketRegime.DISTRIBUTION
+
+def detect_regime(f: MarketFeatures) -> MarketRegime:
+    atr_pct, adx = f.atr_pct, f.adx
+    return _regime_from_bins(
+        0 if atr_pct < 0.006 else (2 if atr_pct > 0.015 else 1),
+        0 if adx < 18 else (2 if adx > 22 else 1),
+        1 if f.volume_z > 1.2 else 0,
+    )
+
+def detect_regime_batch(b: MarketFeaturesBatch) -> np.ndarray:
+    """detect_regime과 같은 우선순위를 마스크로 일괄 적용 → int8 코드 배열"""
+    code = REGIME_CODE
+    out = np.where(b.adx > 22, code[MarketRegime.TREND], code[MarketRegime.DISTRIBUTION]).astype(np.int8)
+    out[(b.atr_pct > 0.015) & (b.volume_z > 1.2)] = code[MarketRegime.SQUEEZE]
+    out[(b.atr_pct < 0.006) & (b.adx < 18)] = code[MarketRegime.CHOP]
+    return out
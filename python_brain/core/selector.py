@@ -7,6 +7,9 @@
 3. 리스크 조정 수익률 (Sharpe-like)
 """
 from typing import List, Optional
+
+import numpy as np
+
 from core.types import StrategyStats
 
 
@@ -17,44 +20,36 @@ def select_best(stats: List[StrategyStats]) -> Optional[StrategyStats]:
     선택 기준:
     1. EV > 0 필수
     2. 복합 점수 = EV * sqrt(confidence) * win_rate_bonus
+    
+    구간별 보너스는 if/elif 대신 마스크 산술로 전 전략에 한 번에 적용
     """
     if not stats:
         return None
     
-    # EV > 0인 것만 필터
-    valid = [s for s in stats if s.ev > 0 and s.confidence > 0.2]
+    n = len(stats)
+    ev = np.fromiter((s.ev for s in stats), dtype=np.float64, count=n)
+    conf = np.fromiter((s.confidence for s in stats), dtype=np.float64, count=n)
+    wr = np.fromiter((s.win_rate for s in stats), dtype=np.float64, count=n)
+    avg_win = np.fromiter((s.avg_win for s in stats), dtype=np.float64, count=n)
+    avg_loss = np.fromiter((s.avg_loss for s in stats), dtype=np.float64, count=n)
     
-    if not valid:
+    # EV > 0인 것만 후보
+    valid = (ev > 0) & (conf > 0.2)
+    if not valid.any():
         return None
     
-    # 복합 점수 계산
-    def composite_score(s: StrategyStats) -> float:
-        # 기본 점수: EV
-        score = s.ev
-        
-        # 신뢰도 가중치 (제곱근으로 완화)
-        score *= (s.confidence ** 0.5)
-        
-        # 승률 보너스 (50% 이상이면 보너스)
-        if s.win_rate > 0.55:
-            score *= 1.2
-        elif s.win_rate > 0.50:
-            score *= 1.1
-        elif s.win_rate < 0.40:
-            score *= 0.8  # 승률 낮으면 페널티
-        
-        # 평균 손익비 (avg_win / avg_loss) 보너스
-        if s.avg_loss > 0:
-            rr_ratio = s.avg_win / s.avg_loss
-            if rr_ratio > 2.0:
-                score *= 1.15
-            elif rr_ratio > 1.5:
-                score *= 1.05
-        
-        return score
+    # 기본 점수: EV * 신뢰도 가중치 (제곱근으로 완화)
+    score = ev * np.sqrt(np.maximum(conf, 0.0))
+    
+    # 승률 보너스: >55% ×1.2, >50% ×1.1, <40% ×0.8
+    score *= 1.0 + 0.2 * (wr > 0.55) + 0.1 * ((wr > 0.50) & (wr <= 0.55)) - 0.2 * (wr < 0.40)
+    
+    # 평균 손익비 (avg_win / avg_loss) 보너스: >2.0 ×1.15, >1.5 ×1.05
+    rr = np.divide(avg_win, avg_loss, out=np.zeros(n), where=avg_loss > 0)
+    score *= 1.0 + 0.15 * (rr > 2.0) + 0.05 * ((rr > 1.5) & (rr <= 2.0))
     
-    # 최고 점수 전략 선택
-    return max(valid, key=composite_score)
+    # 최고 점수 전략 선택 (동점이면 앞쪽)
+    return stats[int(np.argmax(np.where(valid, score, -np.inf)))]
 
 
 def rank_strategies(stats: List[StrategyStats], top_n: int = 3) -> List[StrategyStats]:
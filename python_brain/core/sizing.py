@@ -7,6 +7,8 @@
 3. 최대 손실 제한 (daily drawdown)
 4. 승률 기반 조정
 """
+import numpy as np
+
 from core.types import StrategyStats
 
 
@@ -70,6 +72,36 @@ def position_size(equity: float, stat: StrategyStats,
     return position
 
 
+def position_size_batch(equity: float, ev: np.ndarray, confidence: np.ndarray,
+                        win_rate: np.ndarray, avg_win: np.ndarray, avg_loss: np.ndarray,
+                        base_risk: float = 0.02,
+                        max_risk: float = 0.05,
+                        max_position_pct: float = 0.15) -> np.ndarray:
+    """
+    position_size의 배열 버전 (백테스트에서 신호 N개를 한 번에 사이징)
+    
+    Returns:
+        포지션 크기 배열 (USDT), 진입 금지 조건은 0
+    """
+    ev = np.asarray(ev, dtype=np.float64)
+    confidence = np.asarray(confidence, dtype=np.float64)
+    p = np.asarray(win_rate, dtype=np.float64)
+    aw = np.asarray(avg_win, dtype=np.float64)
+    al = np.asarray(avg_loss, dtype=np.float64)
+    
+    # Kelly = p - q / b (b = avg_win / avg_loss), 통계가 없으면 0.1
+    has_odds = (al > 0) & (aw > 0)
+    b = np.divide(aw, al, out=np.ones_like(aw), where=has_odds)
+    kelly = np.where(has_odds, np.clip(p - (1 - p) / b, 0.0, 0.25), 0.1)
+    
+    risk_pct = base_risk * confidence
+    risk_pct = np.where(kelly > 0.1, np.minimum(risk_pct * (1 + kelly), max_risk), risk_pct)
+    risk_pct = np.where(ev > 0.005, np.minimum(risk_pct * 1.2, max_risk), risk_pct)
+    
+    position = np.minimum(equity * risk_pct, equity * max_position_pct)
+    return np.where((ev > 0) & (confidence >= 0.3), position, 0.0)
+
+
 def dynamic_risk_adjustment(equity: float, 
                            peak_equity: float,
                            daily_pnl: float) -> float:
@@ -1,3 +1,13 @@
+from functools import lru_cache
+
+import numpy as np
+
+from core.types import StrategySignal
+
+# generate 방향 부호 → StrategySignal.direction
+_DIRECTIONS = {1: "long", -1: "short"}
+
+
 class BaseStrategy:
     """
     Strategy is a performance container, NOT a signal generator.
@@ -5,9 +15,21 @@ class BaseStrategy:
 
     name: str = "base"
 
-    def __init__(self):
+    def __init__(self, **params):
+        """
+        params: 클래스 파라미터(대문자 속성) 재정의 - 인스턴스에만 적용되어 다른 인스턴스/스레드와 공유하지 않음
+                예) BreakoutStrategy(MIN_ADX=30, BASE_SL_ATR=1.5)
+        """
+        cls = type(self)
+        for key, value in params.items():
+            if not key.isupper() or not hasattr(cls, key):
+                raise TypeError(f"{cls.__name__}: unknown parameter {key!r}")
+            setattr(self, key, value)
+        
         self.trades = []
         self.total_pnl = 0.0
+        # 같은 MarketFeatures(필드 값 완전 일치)면 generate 결과 재사용 - generate는 순수 함수여야 함
+        self.generate_cached = lru_cache(maxsize=4096)(self.generate)
 
     def record_trade(self, pnl: float):
         self.trades.append(pnl)
@@ -20,3 +42,28 @@ class BaseStrategy:
 
     def trade_count(self) -> int:
         return len(self.trades)
+
+    @staticmethod
+    def _signal(sign: int, price: float, atr_value: float, sl_mult: float, tp_mult: float) -> StrategySignal:
+        """
+        generate 공통 출력: sign +1 롱 / -1 숏
+        손절은 진입 반대쪽, 목표는 진입 방향으로 ATR 배수만큼 (롱/숏 같은 식)
+        """
+        return StrategySignal(
+            direction=_DIRECTIONS[sign],
+            entry=price,
+            stop=price - sign * atr_value * sl_mult,
+            target=price + sign * atr_value * tp_mult
+        )
+
+    @staticmethod
+    def _batch_signals(price, atr_value, long_mask, short_mask, sl_mult, tp_mult):
+        """
+        generate_batch 공통 출력: (direction, entry, stop, target)
+        direction: +1 롱 / -1 숏 / 0 신호 없음 (int8), 신호 없는 행의 stop/target은 NaN
+        """
+        sign = long_mask.astype(np.int8) - short_mask.astype(np.int8)
+        has = sign != 0
+        stop = np.where(has, price - sign * atr_value * sl_mult, np.nan)
+        target = np.where(has, price + sign * atr_value * tp_mult, np.nan)
+        return sign, np.asarray(price, dtype=np.float64), stop, target
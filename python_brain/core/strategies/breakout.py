@@ -1,8 +1,25 @@
-from typing import Optional
+from typing import Final, Optional
+
+import numpy as np
+
 from core.strategies.base import BaseStrategy
-from core.features import MarketFeatures
+from core.features import MarketFeatures, MarketFeaturesBatch
 from core.types import StrategySignal
 
+# 파라미터 기본값 (튜닝 가능) - 인스턴스별 재정의는 BreakoutStrategy(MIN_ADX=..., ...)
+MIN_ADX: Final = 25
+MIN_ATR_PCT: Final = 0.008
+MIN_VOLUME_Z: Final = 0.8
+BASE_SL_ATR: Final = 1.2      # 손절: 1.2 ATR (더 타이트하게)
+HIGH_VOL_SL_ATR: Final = 1.5  # 변동성 높을 때(ATR% > 1.5%) 손절
+BASE_TP_ATR: Final = 2.0      # 기본 목표: 2.0 ATR
+MAX_TP_ATR: Final = 4.0       # 최대 목표 (강한 추세시)
+
+# 목표가 ADX 보너스 기준점 - 진입 문턱(MIN_ADX)과 별개라 MIN_ADX를 바꿔도 보너스 곡선은 그대로
+_ADX_BONUS_BASE: Final = 25
+_ADX_BONUS_SCALE: Final = 0.05   # ADX 25→45일 때 0→1
+_VOLUME_BONUS_SCALE: Final = 0.3
+
 
 class BreakoutStrategy(BaseStrategy):
     """
@@ -16,66 +33,65 @@ class BreakoutStrategy(BaseStrategy):
     """
     name = "breakout"
     
-    # 파라미터 (튜닝 가능)
-    MIN_ADX = 25
-    MIN_ATR_PCT = 0.008
-    MIN_VOLUME_Z = 0.8
-    BASE_SL_ATR = 1.2      # 손절: 1.2 ATR (더 타이트하게)
-    BASE_TP_ATR = 2.0      # 기본 목표: 2.0 ATR
-    MAX_TP_ATR = 4.0       # 최대 목표 (강한 추세시)
+    # 파라미터 (기본값: 모듈 상수)
+    MIN_ADX = MIN_ADX
+    MIN_ATR_PCT = MIN_ATR_PCT
+    MIN_VOLUME_Z = MIN_VOLUME_Z
+    BASE_SL_ATR = BASE_SL_ATR
+    HIGH_VOL_SL_ATR = HIGH_VOL_SL_ATR
+    BASE_TP_ATR = BASE_TP_ATR
+    MAX_TP_ATR = MAX_TP_ATR
+    ADX_BONUS_BASE = _ADX_BONUS_BASE
+    ADX_BONUS_SCALE = _ADX_BONUS_SCALE
+    VOLUME_BONUS_SCALE = _VOLUME_BONUS_SCALE
 
     def generate(self, f: MarketFeatures) -> Optional[StrategySignal]:
-        # 1. 기본 조건 체크
-        if f.adx < self.MIN_ADX:
-            return None
-        if f.atr_pct < self.MIN_ATR_PCT:
-            return None
-        if f.volume_z < self.MIN_VOLUME_Z:
+        adx, atr_pct, volume_z = f.adx, f.atr_pct, f.volume_z
+        min_adx = self.MIN_ADX
+        
+        # 1. 기본 조건 체크 (하나라도 미달이면 스킵)
+        if adx < min_adx or atr_pct < self.MIN_ATR_PCT or volume_z < self.MIN_VOLUME_Z:
             return None
         
         # 2. 동적 목표가 계산 (ADX + 거래량 기반)
         # ADX가 높을수록 추세가 강함 → 목표가 확장
-        adx_bonus = min((f.adx - 25) * 0.05, 1.0)  # ADX 25→45일 때 0→1
-        volume_bonus = min((f.volume_z - 1.0) * 0.3, 0.5)  # 거래량 급증시 보너스
+        adx_bonus = min((adx - self.ADX_BONUS_BASE) * self.ADX_BONUS_SCALE, 1.0)
+        volume_bonus = min((volume_z - 1.0) * self.VOLUME_BONUS_SCALE, 0.5)  # 거래량 급증시 보너스
         
-        tp_multiplier = self.BASE_TP_ATR + adx_bonus + volume_bonus
-        tp_multiplier = min(tp_multiplier, self.MAX_TP_ATR)
+        tp_multiplier = min(self.BASE_TP_ATR + adx_bonus + volume_bonus, self.MAX_TP_ATR)
         
         # 3. 동적 손절 (변동성 높으면 약간 넓게)
-        sl_multiplier = self.BASE_SL_ATR
-        if f.atr_pct > 0.015:  # 변동성 높음
-            sl_multiplier = 1.5
+        sl_multiplier = self.HIGH_VOL_SL_ATR if atr_pct > 0.015 else self.BASE_SL_ATR
         
-        # 4. Long 조건: 상승 추세 돌파
+        # 4. 방향 결정 (롱 +1 / 숏 -1)
         if f.ema_fast_slope > 0.0005 and f.ema_slow_slope > 0:
-            # 펀딩비 체크: 롱 과열이면 스킵
-            if f.funding_rate > 0.0003:  # 0.03% 이상이면 과열
-                return None
-            
-            stop = f.price - (f.atr_value * sl_multiplier)
-            target = f.price + (f.atr_value * tp_multiplier)
-            
-            return StrategySignal(
-                direction="long",
-                entry=f.price,
-                stop=stop,
-                target=target
-            )
+            # 상승 추세 돌파 - 펀딩비 0.03% 이상이면 롱 과열 → 스킵
+            sign = 1 if f.funding_rate <= 0.0003 else 0
+        elif f.ema_fast_slope < -0.0005 and f.ema_slow_slope < 0:
+            # 하락 추세 돌파 - 숏 과열이면 스킵
+            sign = -1 if f.funding_rate >= -0.0003 else 0
+        else:
+            return None
+        if not sign:
+            return None
+        
+        # 5. 손절/목표 (방향 부호로 롱/숏 공통 계산)
+        return self._signal(sign, f.price, f.atr_value, sl_multiplier, tp_multiplier)
+
+    def generate_batch(self, b: MarketFeaturesBatch):
+        """generate를 N행에 일괄 적용 → (direction, entry, stop, target) 배열"""
+        adx, atr_pct, volume_z = b.adx, b.atr_pct, b.volume_z
+        base_ok = (adx >= self.MIN_ADX) & (atr_pct >= self.MIN_ATR_PCT) & (volume_z >= self.MIN_VOLUME_Z)
+        
+        adx_bonus = np.minimum((adx - self.ADX_BONUS_BASE) * self.ADX_BONUS_SCALE, 1.0)
+        volume_bonus = np.minimum((volume_z - 1.0) * self.VOLUME_BONUS_SCALE, 0.5)
+        tp_mult = np.minimum(self.BASE_TP_ATR + adx_bonus + volume_bonus, self.MAX_TP_ATR)
+        sl_mult = np.where(atr_pct > 0.015, self.HIGH_VOL_SL_ATR, self.BASE_SL_ATR)
         
-        # 5. Short 조건: 하락 추세 돌파
-        if f.ema_fast_slope < -0.0005 and f.ema_slow_slope < 0:
-            # 펀딩비 체크: 숏 과열이면 스킵
-            if f.funding_rate < -0.0003:
-                return None
-            
-            stop = f.price + (f.atr_value * sl_multiplier)
-            target = f.price - (f.atr_value * tp_multiplier)
-            
-            return StrategySignal(
-                direction="short",
-                entry=f.price,
-                stop=stop,
-                target=target
-            )
+        # 롱 조건이 맞으면 펀딩 과열이어도 숏으로 넘어가지 않는다 (generate와 동일)
+        long_c = base_ok & (b.ema_fast_slope > 0.0005) & (b.ema_slow_slope > 0)
+        short_c = base_ok & ~long_c & (b.ema_fast_slope < -0.0005) & (b.ema_slow_slope < 0)
+        long_mask = long_c & (b.funding_rate <= 0.0003)
+        short_mask = short_c & (b.funding_rate >= -0.0003)
         
-        return None
+        return self._batch_signals(b.price, b.atr_value, long_mask, short_mask, sl_mult, tp_mult)
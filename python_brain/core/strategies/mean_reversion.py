@@ -1,6 +1,9 @@
 from typing import Optional
+
+import numpy as np
+
 from core.strategies.base import BaseStrategy
-from core.features import MarketFeatures
+from core.features import MarketFeatures, MarketFeaturesBatch
 from core.types import StrategySignal
 
 
@@ -45,49 +48,41 @@ class MeanReversionStrategy(BaseStrategy):
         if f.atr_pct < self.MIN_ATR_PCT:
             return None
         
-        # 4. Long 조건: 과매도
+        # 4. 방향 결정: 과매도 → 롱(+1), 과매수 → 숏(-1)
+        # 거래량 급증 시 더 강한 신호 (패닉 셀 후 반등 기대)
+        volume_boost = f.volume_z > 1.2
         if f.ret_5 < self.WEAK_DIP:
             # 강한 과매도 vs 약한 과매도
             is_strong = f.ret_5 < self.STRONG_DIP and f.ret_1 < -0.005
-            
-            # 거래량 급증 시 더 강한 신호 (패닉 셀 후 반등 기대)
-            volume_boost = f.volume_z > 1.2
-            
-            if not (is_strong or volume_boost or f.ret_1 < -0.003):
-                return None
-            
-            sl_mult = self.BASE_SL_ATR
-            tp_mult = self.STRONG_TP_ATR if is_strong else self.WEAK_TP_ATR
-            
-            stop = f.price - (f.atr_value * sl_mult)
-            target = f.price + (f.atr_value * tp_mult)
-            
-            return StrategySignal(
-                direction="long",
-                entry=f.price,
-                stop=stop,
-                target=target
-            )
-        
-        # 5. Short 조건: 과매수
-        if f.ret_5 > self.WEAK_PUMP:
+            sign = 1 if (is_strong or volume_boost or f.ret_1 < -0.003) else 0
+        elif f.ret_5 > self.WEAK_PUMP:
             is_strong = f.ret_5 > self.STRONG_PUMP and f.ret_1 > 0.005
-            volume_boost = f.volume_z > 1.2
-            
-            if not (is_strong or volume_boost or f.ret_1 > 0.003):
-                return None
-            
-            sl_mult = self.BASE_SL_ATR
-            tp_mult = self.STRONG_TP_ATR if is_strong else self.WEAK_TP_ATR
-            
-            stop = f.price + (f.atr_value * sl_mult)
-            target = f.price - (f.atr_value * tp_mult)
-            
-            return StrategySignal(
-                direction="short",
-                entry=f.price,
-                stop=stop,
-                target=target
-            )
+            sign = -1 if (is_strong or volume_boost or f.ret_1 > 0.003) else 0
+        else:
+            return None
+        if not sign:
+            return None
+        
+        # 5. 손절/익절 (방향 부호로 롱/숏 공통 계산)
+        tp_mult = self.STRONG_TP_ATR if is_strong else self.WEAK_TP_ATR
+        
+        return self._signal(sign, f.price, f.atr_value, self.BASE_SL_ATR, tp_mult)
+
+    def generate_batch(self, b: MarketFeaturesBatch):
+        """generate를 N행에 일괄 적용 → (direction, entry, stop, target) 배열"""
+        ret_1, ret_5 = b.ret_1, b.ret_5
+        base_ok = (b.adx <= self.MAX_ADX) & (b.volume_z <= self.MAX_VOLUME_Z) & (b.atr_pct >= self.MIN_ATR_PCT)
+        volume_boost = b.volume_z > 1.2
+        
+        dip = base_ok & (ret_5 < self.WEAK_DIP)
+        pump = base_ok & ~dip & (ret_5 > self.WEAK_PUMP)
+        strong_dip = (ret_5 < self.STRONG_DIP) & (ret_1 < -0.005)
+        strong_pump = (ret_5 > self.STRONG_PUMP) & (ret_1 > 0.005)
+        
+        long_mask = dip & (strong_dip | volume_boost | (ret_1 < -0.003))
+        short_mask = pump & (strong_pump | volume_boost | (ret_1 > 0.003))
+        
+        is_strong = np.where(long_mask, strong_dip, strong_pump)
+        tp_mult = np.where(is_strong, self.STRONG_TP_ATR, self.WEAK_TP_ATR)
         
-        return None
+        return self._batch_signals(b.price, b.atr_value, long_mask, short_mask, self.BASE_SL_ATR, tp_mult)
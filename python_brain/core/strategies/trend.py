@@ -1,6 +1,9 @@
 from typing import Optional
+
+import numpy as np
+
 from core.strategies.base import BaseStrategy
-from core.features import MarketFeatures
+from core.features import MarketFeatures, MarketFeaturesBatch
 from core.types import StrategySignal
 
 
@@ -50,44 +53,46 @@ class TrendStrategy(BaseStrategy):
             tp_mult += 0.5  # 펀딩비 유리시 보너스
         tp_mult = min(tp_mult, self.MAX_TP_ATR)
         
-        # 6. Long 조건
+        # 6. 방향 결정 (롱 +1 / 숏 -1 / 없음 0)
         if f.ema_fast_slope > 0.001 and f.ema_slow_slope > 0:
             # 모멘텀 확인 또는 펀딩비 유리
-            if not (long_momentum or funding_long_signal):
-                return None
-            
-            sl_mult = self.BASE_SL_ATR
-            # 펀딩비 유리하면 손절 약간 넓게 (버틸 가치 있음)
-            if funding_long_signal:
-                sl_mult = 2.0
-            
-            stop = f.price - (f.atr_value * sl_mult)
-            target = f.price + (f.atr_value * tp_mult)
-            
-            return StrategySignal(
-                direction="long",
-                entry=f.price,
-                stop=stop,
-                target=target
-            )
+            sign = 1 if (long_momentum or funding_long_signal) else 0
+            funding_favored = funding_long_signal
+        elif f.ema_fast_slope < -0.001 and f.ema_slow_slope < 0:
+            sign = -1 if (short_momentum or funding_short_signal) else 0
+            funding_favored = funding_short_signal
+        else:
+            return None
+        if not sign:
+            return None
+        
+        # 7. 손절/목표 (방향 부호로 롱/숏 공통 계산)
+        # 펀딩비 유리하면 손절 약간 넓게 (버틸 가치 있음)
+        sl_mult = 2.0 if funding_favored else self.BASE_SL_ATR
+        
+        return self._signal(sign, f.price, f.atr_value, sl_mult, tp_mult)
+
+    def generate_batch(self, b: MarketFeaturesBatch):
+        """generate를 N행에 일괄 적용 → (direction, entry, stop, target) 배열"""
+        base_ok = (b.adx >= self.MIN_ADX) & (b.atr_pct >= self.MIN_ATR_PCT)
+        
+        funding_long = b.funding_rate < -0.0001
+        funding_short = b.funding_rate > 0.0002
+        long_momentum = (b.ret_1 > 0) & (b.ret_5 > 0)
+        short_momentum = (b.ret_1 < 0) & (b.ret_5 < 0)
+        
+        tp_mult = np.minimum(
+            self.BASE_TP_ATR + 1.0 * (b.adx > self.STRONG_ADX) + 0.5 * (funding_long | funding_short),
+            self.MAX_TP_ATR,
+        )
+        
+        long_c = base_ok & (b.ema_fast_slope > 0.001) & (b.ema_slow_slope > 0)
+        short_c = base_ok & ~long_c & (b.ema_fast_slope < -0.001) & (b.ema_slow_slope < 0)
+        long_mask = long_c & (long_momentum | funding_long)
+        short_mask = short_c & (short_momentum | funding_short)
         
-        # 7. Short 조건
-        if f.ema_fast_slope < -0.001 and f.ema_slow_slope < 0:
-            if not (short_momentum or funding_short_signal):
-                return None
-            
-            sl_mult = self.BASE_SL_ATR
-            if funding_short_signal:
-                sl_mult = 2.0
-            
-            stop = f.price + (f.atr_value * sl_mult)
-            target = f.price - (f.atr_value * tp_mult)
-            
-            return StrategySignal(
-                direction="short",
-                entry=f.price,
-                stop=stop,
-                target=target
-            )
+        # 펀딩비 유리한 방향이면 손절 2.0 ATR
+        wide_sl = np.where(long_mask, funding_long, funding_short)
+        sl_mult = np.where(wide_sl, 2.0, self.BASE_SL_ATR)
         
-        return None
+        return self._batch_signals(b.price, b.atr_value, long_mask, short_mask, sl_mult, tp_mult)
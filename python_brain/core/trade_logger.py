@@ -1,6 +1,43 @@
+import numpy as np
+
+_CODE_DTYPE = np.int16
+_MAX_CODES = int(np.iinfo(_CODE_DTYPE).max) + 1  # 코드 0 ~ 32767
+
 class TradeLogger:
-    def __init__(self):
-        self.logs = []
+    """
+    거래 기록 (열 단위 저장)
+    - pnl / rr / duration: 미리 할당한 배열에 기록, 가득 차면 2배로 확장
+    - strategy / regime: 이름 → int16 코드로 intern (종류가 _MAX_CODES를 넘으면 ValueError)
+    """
+    def __init__(self, capacity: int = 1024):
+        self.n = 0
+        self.pnl = np.empty(capacity, dtype=np.float64)
+        self.rr = np.empty(capacity, dtype=np.float64)
+        self.duration = np.empty(capacity, dtype=np.int32)
+        self.strategy = np.empty(capacity, dtype=_CODE_DTYPE)
+        self.regime = np.empty(capacity, dtype=_CODE_DTYPE)
+        self.strategy_names = []
+        self.regime_names = []
+        self._strategy_code = {}
+        self._regime_code = {}
+
+    def _grow(self):
+        cap = len(self.pnl) * 2
+        for name in ("pnl", "rr", "duration", "strategy", "regime"):
+            old = getattr(self, name)
+            new = np.empty(cap, dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+
+    @staticmethod
+    def _intern(name: str, codes: dict, names: list) -> int:
+        code = codes.get(name)
+        if code is None:
+            if len(names) >= _MAX_CODES:
+                raise ValueError(f"intern 코드 초과: 이름 종류가 {_MAX_CODES}개를 넘음 ({name!r})")
+            code = codes[name] = len(names)
+            names.append(name)
+        return code
 
     def record(
         self,
@@ -10,10 +47,37 @@ class TradeLogger:
         duration: int,
         regime: str
     ):
-        self.logs.append({
-            "strategy": strategy,
-            "pnl": pnl,
-            "rr": rr,
-            "duration": duration,
-            "regime": regime
-        })
+        if self.n == len(self.pnl):
+            self._grow()
+        i = self.n
+        self.pnl[i] = pnl
+        self.rr[i] = rr
+        self.duration[i] = duration
+        self.strategy[i] = self._intern(strategy, self._strategy_code, self.strategy_names)
+        self.regime[i] = self._intern(regime, self._regime_code, self.regime_names)
+        self.n = i + 1
+
+    def __len__(self) -> int:
+        return self.n
+
+    def column(self, name: str) -> np.ndarray:
+        """기록된 구간의 열 뷰 (pnl / rr / duration / strategy / regime 코드)"""
+        return getattr(self, name)[:self.n]
+
+    @property
+    def logs(self) -> list:
+        """기존 dict 리스트 형태 (분석/출력용, 매 호출 새로 생성)"""
+        sn, rn = self.strategy_names, self.regime_names
+        return [
+            {
+                "strategy": sn[s],
+                "pnl": float(p),
+                "rr": float(r),
+                "duration": int(d),
+                "regime": rn[g],
+            }
+            for s, p, r, d, g in zip(
+                self.column("strategy"), self.column("pnl"), self.column("rr"),
+                self.column("duration"), self.column("regime"),
+            )
+        ]
@@ -3,14 +3,14 @@ from typing import Literal
 
 Direction = Literal["long", "short"]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StrategySignal:
     direction: Direction
     entry: float
     stop: float
     target: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StrategyStats:
     name: str
     regime: str
@@ -0,0 +1,27 @@
+# JSON codec (orjson optional)
+"""
+orjson이 있으면 C 구현으로 인코딩/디코딩하고, 없으면 표준 json으로 폴백한다.
+loads는 bytes/str 모두 받고, dumps는 UTF-8 bytes를 돌려준다 (datetime은 ISO 8601 문자열).
+dict 키가 str이 아니면(int/float/bool/None 등) 표준 json처럼 문자열로 바꿔 쓴다.
+"""
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=str, option=option)
+except ImportError:
+    import json
+    from datetime import date, datetime
+
+    loads = json.loads
+
+    def _default(o):
+        if isinstance(o, (datetime, date)):
+            return o.isoformat()
+        return str(o)
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None, default=_default).encode("utf-8")
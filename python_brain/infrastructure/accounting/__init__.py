@@ -1,2 +1 @@
-from .fees import estimate_fee
-from .funding import estimate_funding
+from .fees import estimate_fee, estimate_funding, estimate_fee_arr, estimate_funding_arr
@@ -1,5 +1,17 @@
-def estimate_fee(notional: float, taker_fee: float = 0.0004) -> float:
+import numpy as np
+
+_TAKER_FEE_DEFAULT = 0.0004
+
+
+def estimate_fee(notional: float, taker_fee: float = _TAKER_FEE_DEFAULT) -> float:
     return abs(notional) * taker_fee
 
 def estimate_funding(notional: float, funding_rate: float) -> float:
     return abs(notional) * funding_rate
+
+# 배열 버전 (백테스트/일괄 계산용) - funding_rate는 스칼라 또는 notional과 같은 길이 배열
+def estimate_fee_arr(notional: np.ndarray, taker_fee: float = _TAKER_FEE_DEFAULT) -> np.ndarray:
+    return np.abs(notional) * taker_fee
+
+def estimate_funding_arr(notional: np.ndarray, funding_rate) -> np.ndarray:
+    return np.abs(notional) * funding_rate
@@ -4,18 +4,21 @@ from infrastructure.exchange.types import OrderRequest, OrderResult
 class BinanceFuturesClient:
     def __init__(self, api_key: str, api_secret: str):
         self.client = Client(api_key, api_secret)
+        self._create_order = self.client.futures_create_order
 
     def place_order(self, req: OrderRequest) -> OrderResult:
-        resp = self.client.futures_create_order(
+        # RESULT: 체결 결과(avgPrice/executedQty)까지 주문 응답에 포함 → 후속 조회 불필요
+        resp = self._create_order(
             symbol=req.symbol,
             side=req.side,
             type=req.order_type,
-            quantity=req.quantity
+            quantity=req.quantity,
+            newOrderRespType="RESULT"
         )
 
         executed_qty = float(resp.get("executedQty", 0.0))
 
-        # Futures는 fills가 없을 수 있음 → avgPrice/price/후속조회로 보강
+        # Futures는 fills가 없을 수 있음 → avgPrice/price/후속조회로 보강 (RESULT 응답이면 후속조회는 거의 타지 않음)
         avg_price = 0.0
         if "avgPrice" in resp:
             try:
@@ -0,0 +1,74 @@
+import numpy as np
+
+# 열 순서: high, low, close, volume
+KLINE_COLUMNS = ("high", "low", "close", "volume")
+
+
+class KlineBuffer:
+    """
+    최근 maxlen개 kline 링버퍼 (심볼/인터벌 1개당 1개)
+
+    - 각 봉을 buf[i], buf[i + maxlen] 두 곳에 기록해 view()가 항상 시간순 연속 뷰
+    - 같은 open time이 다시 오면(진행 중인 봉 갱신) 마지막 행을 덮어쓴다
+    """
+    __slots__ = ("maxlen", "interval_ms", "buf", "idx", "n", "last_open_time")
+
+    def __init__(self, maxlen: int, interval_ms: int = 0):
+        self.maxlen = maxlen
+        self.interval_ms = interval_ms  # 봉 간격(ms) - update(allow_next=True)에서만 사용
+        self.buf = np.zeros((maxlen * 2, len(KLINE_COLUMNS)), dtype=np.float64)
+        self.idx = 0  # 다음 기록 위치 (0 ~ maxlen-1)
+        self.n = 0
+        self.last_open_time = -1
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _write(self, i: int, row):
+        self.buf[i] = self.buf[i + self.maxlen] = row
+
+    def _push(self, open_time: int, row):
+        if open_time == self.last_open_time:
+            self._write((self.idx - 1) % self.maxlen, row)
+            return
+        self._write(self.idx, row)
+        self.idx = (self.idx + 1) % self.maxlen
+        if self.n < self.maxlen:
+            self.n += 1
+        self.last_open_time = open_time
+
+    def reset(self, klines):
+        """REST klines 응답 전체로 버퍼를 다시 채운다"""
+        self.idx = 0
+        self.n = 0
+        self.last_open_time = -1
+        self.update(klines)
+
+    def update(self, klines, allow_next: bool = False) -> bool:
+        """
+        최근 kline 몇 개(REST 응답 행 또는 [open_time, o, h, l, c, v, ...])를 병합
+        
+        allow_next=False (REST): 첫 행이 마지막 저장 봉과 겹쳐야 연속으로 판단
+            - 한 interval 뒤 봉부터 오면 저장된 마지막 봉이 진행 중 스냅샷 그대로 굳을 수 있음
+        allow_next=True (웹소켓 메시지): 직전 봉은 확정(x) 메시지로 이미 갱신됐으므로
+            바로 다음 봉(last + interval_ms)까지 연속으로 인정
+        
+        Returns:
+            False면 기존 버퍼와 이어지지 않음(누락/미갱신 봉 있음) → reset 필요
+        """
+        if not klines:
+            return True
+        limit = self.last_open_time + (self.interval_ms if allow_next else 0)
+        if self.n and int(klines[0][0]) > limit:
+            return False
+        for k in klines:
+            t = int(k[0])
+            if t < self.last_open_time:
+                continue
+            self._push(t, (float(k[2]), float(k[3]), float(k[4]), float(k[5])))
+        return True
+
+    def view(self) -> np.ndarray:
+        """(n, 4) 시간순 뷰 [high, low, close, volume] - 다음 update 전까지 유효"""
+        start = self.idx if self.n == self.maxlen else 0
+        return self.buf[start:start + self.n]
@@ -3,14 +3,14 @@ from typing import Literal
 
 Side = Literal["BUY", "SELL"]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrderRequest:
     symbol: str
     side: Side
     quantity: float
     order_type: str = "MARKET"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrderResult:
     order_id: str
     executed_qty: float
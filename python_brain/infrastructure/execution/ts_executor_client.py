@@ -1,5 +1,7 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, Any
 
 class TsExecutorClient:
@@ -7,6 +9,16 @@ class TsExecutorClient:
         self.base_url = base_url.rstrip("/")
         self.token = token or ""
         self.timeout = timeout
+        # 같은 executor로 keep-alive 연결 재사용 (주문마다 TCP/TLS 핸드셰이크 없음)
+        self._session = requests.Session()
+        # 조회(GET)만 1회 재시도 - 주문 POST는 중복 체결 위험이 있어 재시도하지 않음
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=4,
+            max_retries=Retry(total=1, backoff_factor=0.1, status_forcelist=(502, 503, 504), allowed_methods=("GET",)),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._auth_headers = self._headers()
 
     def _headers(self) -> Dict[str, str]:
         h = {"Content-Type": "application/json"}
@@ -16,7 +28,7 @@ class TsExecutorClient:
 
     def health(self) -> bool:
         try:
-            r = requests.get(f"{self.base_url}/health", timeout=self.timeout)
+            r = self._session.get(f"{self.base_url}/health", timeout=self.timeout)
             return r.ok
         except Exception:
             return False
@@ -29,28 +41,28 @@ class TsExecutorClient:
             "orderType": "MARKET",
             "reduceOnly": bool(reduce_only),
         }
-        r = requests.post(
+        r = self._session.post(
             f"{self.base_url}/execute",
             json=payload,
-            headers=self._headers(),
+            headers=self._auth_headers,
             timeout=self.timeout
         )
         r.raise_for_status()
         return r.json()
 
     def get_balance(self) -> Dict[str, Any]:
-        r = requests.get(
+        r = self._session.get(
             f"{self.base_url}/account/balance",
-            headers=self._headers(),
+            headers=self._auth_headers,
             timeout=self.timeout
         )
         r.raise_for_status()
         return r.json()
 
     def get_position(self, symbol: str) -> Dict[str, Any]:
-        r = requests.get(
+        r = self._session.get(
             f"{self.base_url}/account/position/{symbol}",
-            headers=self._headers(),
+            headers=self._auth_headers,
             timeout=self.timeout
         )
         r.raise_for_status()
@@ -0,0 +1,117 @@
+# Binance futures market stream (kline + mark price)
+"""
+[실시간 시장 데이터 스트림]
+
+wss://fstream.binance.com/stream?streams=<sym>@kline_<iv>/<sym>@markPrice@1s
+하나를 백그라운드 스레드에서 구독해 KlineBuffer와 markPrice/펀딩비를 메모리에 유지한다.
+build_features는 snapshot()만 읽으면 되고, 준비가 안 됐거나 끊긴 경우 None → REST 폴백.
+메인 루프는 wait_bar_close()로 봉 마감 시점에 바로 깨어날 수 있다.
+
+websockets 패키지가 필요하다 (pip install websockets).
+"""
+import asyncio
+import threading
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+from infrastructure.exchange.kline_buffer import KlineBuffer
+from infrastructure._json import loads as json_loads
+
+try:
+    import websockets
+except ImportError:  # 선택 의존성
+    websockets = None
+
+WS_BASE = "wss://fstream.binance.com/stream"
+
+_INTERVAL_UNIT_MS = {"m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+
+
+def interval_ms(interval: str) -> int:
+    """'5m' → 300000"""
+    return int(interval[:-1]) * _INTERVAL_UNIT_MS[interval[-1]]
+
+
+class MarketStream:
+    def __init__(self, symbol: str, interval: str = "5m", window: int = 30,
+                 stale_sec: float = 15.0):
+        if websockets is None:
+            raise ImportError("MarketStream requires the 'websockets' package")
+        sym = symbol.lower()
+        self.url = f"{WS_BASE}?streams={sym}@kline_{interval}/{sym}@markPrice@1s"
+        self.stale_sec = stale_sec
+        self.klines = KlineBuffer(window, interval_ms(interval))
+        self.price = 0.0
+        self.funding_rate = 0.0
+        self.needs_seed = True      # REST로 초기 kline을 채워야 함 (최초/누락 봉 발생 시)
+        self.last_msg_ts = 0.0
+        self._lock = threading.Lock()
+        self._bar_closed = threading.Event()  # 확정 봉(k.x) 수신 시 set
+        self._thread = None
+
+    # ============================================================
+    # 수명 주기
+    # ============================================================
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=lambda: asyncio.run(self._run()),
+                                            name="market-ws", daemon=True)
+            self._thread.start()
+        return self
+
+    async def _run(self):
+        backoff = 1.0
+        while True:
+            try:
+                async with websockets.connect(self.url, ping_interval=20, ping_timeout=20) as ws:
+                    backoff = 1.0
+                    async for raw in ws:
+                        self._on_message(json_loads(raw))
+            except Exception:
+                pass
+            # 끊겼다가 다시 붙으면 그 사이 봉이 빠졌을 수 있음
+            with self._lock:
+                self.needs_seed = True
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    # ============================================================
+    # 메시지 처리
+    # ============================================================
+    def _on_message(self, msg: dict):
+        data = msg.get("data", msg)
+        event = data.get("e")
+        with self._lock:
+            self.last_msg_ts = time.monotonic()
+            if event == "kline":
+                k = data["k"]
+                if not self.klines.update([(k["t"], k["o"], k["h"], k["l"], k["c"], k["v"])], allow_next=True):
+                    self.needs_seed = True
+                if k.get("x"):
+                    self._bar_closed.set()
+            elif event == "markPriceUpdate":
+                self.price = float(data["p"])
+                self.funding_rate = float(data.get("r") or 0.0)
+
+    def wait_bar_close(self, timeout: float) -> bool:
+        """다음 봉 마감까지 최대 timeout초 대기 - 마감으로 깨어났으면 True"""
+        closed = self._bar_closed.wait(timeout)
+        self._bar_closed.clear()
+        return closed
+
+    def seed(self, klines):
+        """REST klines 응답으로 버퍼 재구성"""
+        with self._lock:
+            self.klines.reset(klines)
+            self.needs_seed = False
+
+    def snapshot(self) -> Optional[Tuple[float, float, np.ndarray]]:
+        """(mark price, funding rate, (n, 4) ohlcv 사본) - 준비 안 됨/끊김이면 None"""
+        with self._lock:
+            if self.needs_seed or self.price <= 0:
+                return None
+            if time.monotonic() - self.last_msg_ts > self.stale_sec:
+                return None
+            return self.price, self.funding_rate, self.klines.view().copy()
@@ -1 +1 @@
-from .position_tracker import PositionTracker
+from .position_tracker import Position, PositionTracker
@@ -1,3 +1,12 @@
+from typing import NamedTuple
+
+
+class Position(NamedTuple):
+    size: float
+    entry_price: float
+    unrealized_pnl: float
+
+
 class PositionTracker:
     def __init__(self):
         self.position = None
@@ -12,11 +21,11 @@ class PositionTracker:
             self.position = None
             return
 
-        self.position = {
-            "size": size,
-            "entry_price": float(position_info.get("entryPrice", 0.0)),
-            "unrealized_pnl": float(position_info.get("unRealizedProfit", 0.0))
-        }
+        self.position = Position(
+            size=size,
+            entry_price=float(position_info.get("entryPrice", 0.0)),
+            unrealized_pnl=float(position_info.get("unRealizedProfit", 0.0))
+        )
 
     def is_open(self) -> bool:
         return self.position is not None
@@ -2,14 +2,19 @@ import time
 import os
 import traceback
 
+from config.settings import env_flag
 from core.engine import TradingEngine
 from core.features import MarketFeatures
+from core.indicators_njit import wilder_atr_adx
+from core import decide_njit, fast_score, indicators_njit
 
 from infrastructure.position_tracker import PositionTracker
 from infrastructure.executor import TradeExecutor
 from infrastructure.executor_factory import create_executor_and_data_clients
 
 from infrastructure.exchange.binance_futures import BinanceFuturesClient
+from infrastructure.exchange.kline_buffer import KlineBuffer
+from infrastructure._json import loads as json_loads
 from infrastructure.ts_executor_client import TsExecutorClient
 
 from monitor.logger import TradeLogger
@@ -23,6 +28,9 @@ from monitor.telegram_bot import TelegramBot
 SYMBOL = os.getenv("SYMBOL", "BTCUSDT")
 INTERVAL_SEC = int(os.getenv("INTERVAL_SEC", "60"))
 EXECUTOR_MODE = os.getenv("EXECUTOR_MODE", "local").strip().lower()
+# 1이면 kline/markPrice를 웹소켓 스트림으로 받고 REST는 폴백으로만 사용
+# (메인 루프도 5분봉 마감 시 바로 깨어남, 최대 대기는 INTERVAL_SEC)
+MARKET_WS = env_flag("MARKET_WS")
 
 TG_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 TG_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
@@ -59,95 +67,145 @@ equity = 0.0  # 실계좌면 조회해서 세팅(아래에서 동기화)
 # =========================
 
 import requests
+import numpy as np
+from dataclasses import replace
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 공개 API용 keep-alive 세션 (틱마다 TCP/TLS 핸드셰이크 재사용)
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(
+    pool_connections=2, pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=("GET",)),
+))
+
+# premiumIndex와 klines는 서로 독립 → klines를 백그라운드 스레드에서 동시에 조회
+_fetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="market-fetch")
+
+def _get_json(url: str, params: dict):
+    r = _http.get(url, params=params, timeout=5)
+    r.raise_for_status()
+    return json_loads(r.content)
+
+# 5분봉 30개 = 2.5시간 데이터 - 최초 1회만 전체를 받고 이후에는 최근 2개(직전 확정 봉 + 진행 중 봉)만 병합
+# (응답 첫 봉이 저장된 마지막 봉과 겹치지 않으면 - 틱이 늦어 봉을 건너뛴 경우 - 전체 재조회)
+KLINE_WINDOW = 30
+_kline_buffers = {}
+
+def _fetch_klines(symbol: str) -> np.ndarray:
+    """심볼별 kline 링버퍼를 최신화하고 (n, 4) [high, low, close, volume] 사본 반환"""
+    buf = _kline_buffers.get(symbol)
+    if buf is None:
+        buf = _kline_buffers[symbol] = KlineBuffer(KLINE_WINDOW)
+    url = "https://fapi.binance.com/fapi/v1/klines"
+    if len(buf) < KLINE_WINDOW or not buf.update(_get_json(url, {"symbol": symbol, "interval": "5m", "limit": 2})):
+        buf.reset(_get_json(url, {"symbol": symbol, "interval": "5m", "limit": KLINE_WINDOW}))
+    return buf.view().copy()
+
+_market_streams = {}
+
+def _stream_snapshot(symbol: str):
+    """MARKET_WS 모드: (price, funding_rate, ohlcv) 또는 None(스트림 미준비 → REST 사용)"""
+    global MARKET_WS
+    stream = _market_streams.get(symbol)
+    if stream is None:
+        try:
+            from infrastructure.market_ws import MarketStream
+            stream = MarketStream(symbol, "5m", KLINE_WINDOW)
+        except ImportError as e:
+            # websockets 미설치 → 경고 1회 후 REST 폴링으로 고정 (틱마다 재시도하지 않음)
+            print(f"[MarketWS] 웹소켓 스트림 비활성화, REST로 폴백: {e}")
+            MARKET_WS = False
+            return None
+        _market_streams[symbol] = stream.start()
+    if stream.needs_seed:
+        stream.seed(_get_json("https://fapi.binance.com/fapi/v1/klines",
+                              {"symbol": symbol, "interval": "5m", "limit": KLINE_WINDOW}))
+    return stream.snapshot()
+
+def _wait_next_tick(symbol: str):
+    """다음 판단 시점까지 대기 - 스트림이 있으면 봉 마감 즉시, 없으면 INTERVAL_SEC 폴링"""
+    stream = _market_streams.get(symbol) if MARKET_WS else None
+    if stream is None:
+        time.sleep(INTERVAL_SEC)
+    else:
+        stream.wait_bar_close(INTERVAL_SEC)
+
+@lru_cache(maxsize=8)
+def _ema_weights(n: int, period: int) -> np.ndarray:
+    """result = data[0], result = k·x + (1-k)·result 재귀를 길이 n에 대해 펼친 가중치"""
+    k = 2 / (period + 1)
+    w = k * (1 - k) ** np.arange(n - 1, -1, -1, dtype=np.float64)
+    w[0] = (1 - k) ** (n - 1)
+    w.setflags(write=False)
+    return w
+
+def _ema_prev_now(closes: np.ndarray, period: int):
+    """(직전 봉까지 EMA, 현재 EMA) - 기간보다 짧으면 해당 시점 종가"""
+    n = len(closes)
+    prev = float(closes[:-1] @ _ema_weights(n - 1, period)) if n - 1 >= period else float(closes[-2])
+    now = float(closes @ _ema_weights(n, period)) if n >= period else float(closes[-1])
+    return prev, now
+
+# kline 데이터 부족 시 반환할 기본 특징값 템플릿
+_DEFAULT_FEATURES = MarketFeatures(
+    price=0.0, atr_pct=0.01, atr_value=0.0, adx=20.0,
+    ema_fast_slope=0.0, ema_slow_slope=0.0, volume_z=1.0,
+    funding_rate=0.0, ret_1=0.0, ret_5=0.0
+)
 
 def build_features(symbol: str) -> MarketFeatures:
     """
     Binance Public API로 실제 지표를 계산한다.
     - klines: ATR, ADX, EMA slope, 수익률 계산
     - premiumIndex: markPrice, funding rate
+    - MARKET_WS=1이면 웹소켓 스트림 값을 우선 사용
     """
-    # 1) 현재가 + 펀딩비
-    r = requests.get("https://fapi.binance.com/fapi/v1/premiumIndex", params={"symbol": symbol}, timeout=5)
-    r.raise_for_status()
-    j = r.json()
-    price = float(j["markPrice"])
-    funding_rate = float(j.get("lastFundingRate", 0.0))
-    
-    # 2) klines (5분봉 30개 = 2.5시간 데이터)
-    kr = requests.get(
-        "https://fapi.binance.com/fapi/v1/klines",
-        params={"symbol": symbol, "interval": "5m", "limit": 30},
-        timeout=5
-    )
-    kr.raise_for_status()
-    klines = kr.json()
+    snap = _stream_snapshot(symbol) if MARKET_WS else None
+    if snap is not None:
+        # 0) 스트림이 살아 있으면 메모리에서 바로 읽음
+        price, funding_rate, ohlcv = snap
+    else:
+        # 2) klines - 먼저 요청을 띄워 두고
+        klines_future = _fetch_pool.submit(_fetch_klines, symbol)
+        
+        # 1) 현재가 + 펀딩비 (그 사이 현재 스레드에서 조회)
+        j = _get_json("https://fapi.binance.com/fapi/v1/premiumIndex", {"symbol": symbol})
+        price = float(j["markPrice"])
+        funding_rate = float(j.get("lastFundingRate", 0.0))
+        
+        ohlcv = klines_future.result()
     
-    if len(klines) < 20:
-        # 데이터 부족시 기본값 반환
-        return MarketFeatures(
-            price=price, atr_pct=0.01, atr_value=price * 0.01, adx=20,
-            ema_fast_slope=0.0, ema_slow_slope=0.0, volume_z=1.0,
-            funding_rate=funding_rate, ret_1=0.0, ret_5=0.0
-        )
+    if len(ohlcv) < 20:
+        # 데이터 부족시 기본값 반환 (가격/펀딩 관련 필드만 채움)
+        return replace(_DEFAULT_FEATURES, price=price, atr_value=price * 0.01, funding_rate=funding_rate)
     
-    # OHLCV 파싱
-    highs = [float(k[2]) for k in klines]
-    lows = [float(k[3]) for k in klines]
-    closes = [float(k[4]) for k in klines]
-    volumes = [float(k[5]) for k in klines]
+    # (n, 4) 행 우선 배열의 열은 stride가 있어 numba가 'A' 레이아웃으로 재컴파일함
+    # → warmup이 컴파일한 C 연속 시그니처에 맞게 열마다 연속 사본
+    highs, lows, closes, volumes = (np.ascontiguousarray(c) for c in ohlcv.T)
+    n = len(closes)
     
-    # 3) ATR 계산 (14기간)
-    trs = []
-    for i in range(1, len(klines)):
-        tr = max(
-            highs[i] - lows[i],
-            abs(highs[i] - closes[i-1]),
-            abs(lows[i] - closes[i-1])
-        )
-        trs.append(tr)
-    atr_value = sum(trs[-14:]) / 14 if len(trs) >= 14 else sum(trs) / max(len(trs), 1)
+    # 3) ATR + 4) ADX (Wilder 평활, 14기간)
+    atr_value, adx = wilder_atr_adx(highs, lows, closes, 14)
+    atr_value, adx = float(atr_value), float(adx)
     atr_pct = atr_value / price
     
-    # 4) ADX 간략 계산 (DX 평균)
-    plus_dm = []
-    minus_dm = []
-    for i in range(1, len(klines)):
-        up = highs[i] - highs[i-1]
-        down = lows[i-1] - lows[i]
-        plus_dm.append(up if up > down and up > 0 else 0)
-        minus_dm.append(down if down > up and down > 0 else 0)
-    
-    atr_sum = sum(trs[-14:]) if len(trs) >= 14 else sum(trs)
-    plus_di = 100 * sum(plus_dm[-14:]) / max(atr_sum, 0.0001)
-    minus_di = 100 * sum(minus_dm[-14:]) / max(atr_sum, 0.0001)
-    dx = 100 * abs(plus_di - minus_di) / max(plus_di + minus_di, 0.0001)
-    adx = dx  # 단순화 (실제는 smoothed)
-    
-    # 5) EMA slope (9기간 fast, 21기간 slow)
-    def ema(data, period):
-        if len(data) < period:
-            return data[-1] if data else 0
-        k = 2 / (period + 1)
-        result = data[0]
-        for val in data[1:]:
-            result = val * k + result * (1 - k)
-        return result
-    
-    ema_fast_now = ema(closes, 9)
-    ema_fast_prev = ema(closes[:-1], 9)
-    ema_slow_now = ema(closes, 21)
-    ema_slow_prev = ema(closes[:-1], 21)
+    # 5) EMA slope (9기간 fast, 21기간 slow) - 재귀를 펼친 가중치와의 내적
+    ema_fast_prev, ema_fast_now = _ema_prev_now(closes, 9)
+    ema_slow_prev, ema_slow_now = _ema_prev_now(closes, 21)
     
     ema_fast_slope = (ema_fast_now - ema_fast_prev) / max(ema_fast_prev, 0.0001)
     ema_slow_slope = (ema_slow_now - ema_slow_prev) / max(ema_slow_prev, 0.0001)
     
     # 6) Volume Z-score
-    vol_mean = sum(volumes) / len(volumes)
-    vol_std = (sum((v - vol_mean) ** 2 for v in volumes) / len(volumes)) ** 0.5
-    volume_z = (volumes[-1] - vol_mean) / max(vol_std, 0.0001)
+    vol_mean = float(volumes.mean())
+    vol_std = float(volumes.std())
+    volume_z = (float(volumes[-1]) - vol_mean) / max(vol_std, 0.0001)
     
     # 7) 수익률 (1분, 5분 approximation from 5m candles)
-    ret_5 = (closes[-1] - closes[-2]) / closes[-2] if len(closes) >= 2 else 0.0
+    ret_5 = float((closes[-1] - closes[-2]) / closes[-2]) if n >= 2 else 0.0
     ret_1 = ret_5 / 5  # 5분봉 기준 추정
     
     return MarketFeatures(
@@ -170,6 +228,11 @@ def build_features(symbol: str) -> MarketFeatures:
 def main():
     global equity
 
+    # JIT 커널 컴파일(또는 캐시 로드)을 첫 틱 전에 끝낸다
+    indicators_njit.warmup()
+    decide_njit.warmup()
+    fast_score.warmup()
+
     logger.system("ENGINE_START", {"symbol": SYMBOL, "mode": EXECUTOR_MODE})
     if telegram:
         telegram.send(f"🚀 Quant Engine Started ({SYMBOL}) mode={EXECUTOR_MODE}")
@@ -214,7 +277,7 @@ def main():
 
             # 5) 포지션 종료 감지 → 리포트(현재는 단순 unrealized 기준, 향후 realized로 확장)
             if prev_open and not now_open:
-                pnl = tracker.position["unrealized_pnl"] if tracker.position else 0.0
+                pnl = tracker.position.unrealized_pnl if tracker.position else 0.0
                 logger.trade("CLOSE", {"pnl": pnl})
                 reporter.record_trade(pnl)
                 if telegram:
@@ -226,7 +289,7 @@ def main():
             if telegram:
                 telegram.error_alert(err)
 
-        time.sleep(INTERVAL_SEC)
+        _wait_next_tick(SYMBOL)
 
 # =========================
 # 5. 엔트리 포인트
@@ -3,11 +3,16 @@
 구조화된 로깅
 """
 import sys
-import json
+import atexit
+import queue
+import threading
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Literal, Optional
 from enum import Enum
 
+from infrastructure._json import dumps as json_dumps, loads as json_loads
+
 
 class LogLevel(Enum):
     DEBUG = 0
@@ -17,31 +22,89 @@ class LogLevel(Enum):
     CRITICAL = 4
 
 
+# 레벨별 색상 (ANSI)
+_COLORS = {
+    LogLevel.DEBUG: '\033[90m',    # 회색
+    LogLevel.INFO: '\033[92m',     # 녹색
+    LogLevel.WARNING: '\033[93m',  # 노란색
+    LogLevel.ERROR: '\033[91m',    # 빨간색
+    LogLevel.CRITICAL: '\033[95m'  # 보라색
+}
+_RESET = '\033[0m'
+
+def _encoder(serializer: str):
+    """로그 엔트리 → 파일에 쓸 bytes (msgpack은 자체 구분이라 줄바꿈 없음)"""
+    if serializer == 'msgpack':
+        import msgpack  # 선택 의존성
+        return msgpack.Packer(use_bin_type=True, default=str).pack
+    if serializer == 'json':
+        return lambda entry: json_dumps(entry) + b'\n'
+    raise ValueError(f"unknown serializer: {serializer!r}")
+
+
+def read_log(path: str, serializer: Literal['json', 'msgpack'] = 'json') -> Iterator[Dict]:
+    """Logger 파일 로그를 엔트리 dict 단위로 읽기"""
+    with open(path, 'rb') as f:
+        if serializer == 'msgpack':
+            import msgpack
+            yield from msgpack.Unpacker(f, raw=False)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json_loads(line)
+
+
+# 파일 writer 스레드 제어용 표식
+_FLUSH = object()
+_STOP = object()
+
+# 큐가 가득 찼을 때 DEBUG 외 로그가 자리를 기다리는 최대 시간 (초) - 넘기면 버리고 집계
+_PUT_TIMEOUT = 1.0
+
+
 class Logger:
     """
     구조화된 로거
-    - 콘솔 출력
-    - 파일 저장
-    - JSON 포맷
+    - 콘솔 출력 (호출 스레드에서 바로)
+    - 파일 저장: 큐에 넣기만 하고 writer 스레드가 직렬화/기록
+      (flush: flush_every건마다 / ERROR 이상 / 큐가 1초간 비었을 때 / close 시)
+    - 기록 실패는 stderr로 알리고 다음 엔트리로 진행, 큐 적체로 버린 건수는 dropped
+    - 파일 포맷: JSON Lines (기본) 또는 msgpack (serializer='msgpack', 읽기는 read_log)
     """
     
     def __init__(self, name: str = "TradingBot", level: LogLevel = LogLevel.INFO,
-                 log_file: Optional[str] = None):
+                 log_file: Optional[str] = None, flush_every: int = 100,
+                 queue_size: int = 10000,
+                 serializer: Literal['json', 'msgpack'] = 'json'):
         self.name = name
         self.level = level
         self.log_file = log_file
+        self.flush_every = flush_every
+        self.serializer = serializer
         
-        # 파일 핸들러
+        # 초 단위 타임스탬프 문자열 캐시 (같은 초 안의 로그는 마이크로초만 붙임)
+        # (초, 문자열)을 튜플 하나로 교체 → 여러 스레드가 읽어도 초와 문자열 짝이 어긋나지 않음
+        self._ts_cache = (-1, '')
+        
+        # 파일 핸들러 (64KB 버퍼 - 매 건 write syscall 방지)
         self._file_handler = None
+        self._queue = None
+        self._writer = None
+        self.dropped = 0
         if log_file:
-            self._file_handler = open(log_file, 'a', encoding='utf-8')
+            self._encode = _encoder(serializer)
+            self._file_handler = open(log_file, 'ab', buffering=65536)
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._writer = threading.Thread(target=self._writer_loop, name=f"{name}-log-writer", daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
     
     def _log(self, level: LogLevel, message: str, data: Optional[Dict] = None):
         """내부 로깅"""
         if level.value < self.level.value:
             return
         
-        timestamp = datetime.now().isoformat()
+        timestamp = self._timestamp()
         
         log_entry = {
             'timestamp': timestamp,
@@ -56,29 +119,80 @@ class Logger:
         # 콘솔 출력
         self._print_console(level, timestamp, message, data)
         
-        # 파일 저장
-        if self._file_handler:
-            self._file_handler.write(json.dumps(log_entry, ensure_ascii=False) + '\n')
-            self._file_handler.flush()
+        # 파일 저장 (writer 스레드로 넘김, 큐가 가득 차면 DEBUG는 버림)
+        # 그 외 레벨도 writer가 죽었거나 _PUT_TIMEOUT 안에 자리가 안 나면 버림 → 매매 루프는 막히지 않음
+        if self._queue is not None:
+            try:
+                self._queue.put_nowait(log_entry)
+            except queue.Full:
+                if level is LogLevel.DEBUG or not self._writer.is_alive():
+                    self.dropped += 1
+                    return
+                try:
+                    self._queue.put(log_entry, timeout=_PUT_TIMEOUT)
+                except queue.Full:
+                    self.dropped += 1
+    
+    def _timestamp(self) -> str:
+        """로컬 시각 ISO 8601 - datetime.now().isoformat()과 같은 형식 (마이크로초, 0이면 생략)"""
+        t = time.time()
+        sec = int(t)
+        usec = int((t - sec) * 1_000_000)
+        cached_sec, sec_str = self._ts_cache
+        if cached_sec != sec:
+            sec_str = datetime.fromtimestamp(sec).isoformat()
+            self._ts_cache = (sec, sec_str)
+        return f"{sec_str}.{usec:06d}" if usec else sec_str
+    
+    def _writer_loop(self):
+        """큐 → 파일 (writer 스레드)"""
+        fh = self._file_handler
+        pending = 0
+        while True:
+            try:
+                item = self._queue.get(timeout=1.0)
+            except queue.Empty:
+                # 한동안 로그가 없으면 쌓인 것 기록
+                if pending:
+                    fh.flush()
+                    pending = 0
+                continue
+            
+            if item is _STOP or item is _FLUSH:
+                fh.flush()
+                pending = 0
+                self._queue.task_done()
+                if item is _STOP:
+                    return
+                continue
+            
+            try:
+                fh.write(self._encode(item))
+                pending += 1
+                # 에러는 즉시 기록 (크래시 직전 로그 유실 방지)
+                if pending >= self.flush_every or LogLevel[item['level']].value >= LogLevel.ERROR.value:
+                    fh.flush()
+                    pending = 0
+            except Exception as e:
+                # 직렬화/쓰기 실패 1건 때문에 writer가 죽으면 이후 로그 호출이 전부 막힘
+                print(f"[Logger] 파일 기록 실패 ({item.get('message')!r}): {e!r}", file=sys.stderr)
+            finally:
+                self._queue.task_done()
+    
+    def flush(self):
+        """큐에 쌓인 파일 로그를 모두 기록할 때까지 대기"""
+        if self._queue is not None and self._writer.is_alive():
+            self._queue.put(_FLUSH)
+            self._queue.join()
     
     def _print_console(self, level: LogLevel, timestamp: str, 
                        message: str, data: Optional[Dict]):
         """콘솔 출력"""
         
-        # 레벨별 색상 (ANSI)
-        colors = {
-            LogLevel.DEBUG: '\033[90m',    # 회색
-            LogLevel.INFO: '\033[92m',     # 녹색
-            LogLevel.WARNING: '\033[93m',  # 노란색
-            LogLevel.ERROR: '\033[91m',    # 빨간색
-            LogLevel.CRITICAL: '\033[95m'  # 보라색
-        }
-        reset = '\033[0m'
-        
-        color = colors.get(level, '')
+        color = _COLORS.get(level, '')
         time_short = timestamp[11:19]  # HH:MM:SS
         
-        output = f"{color}[{time_short}] [{level.name:8}] {message}{reset}"
+        output = f"{color}[{time_short}] [{level.name:8}] {message}{_RESET}"
         
         if data:
             data_str = ' | '.join(f"{k}={v}" for k, v in data.items())
@@ -86,6 +200,10 @@ class Logger:
         
         print(output)
     
+    def enabled_for(self, level: LogLevel) -> bool:
+        """level 로그가 실제로 기록되는지 (호출 측에서 비싼 인자 생성 전 확인용)"""
+        return level.value >= self.level.value
+    
     def debug(self, message: str, **kwargs):
         self._log(LogLevel.DEBUG, message, kwargs if kwargs else None)
     
@@ -104,6 +222,8 @@ class Logger:
     def trade(self, action: str, symbol: str, price: float, size: float, 
               reason: str, pnl: Optional[float] = None):
         """거래 로그"""
+        if not self.enabled_for(LogLevel.INFO):
+            return  # 출력되지 않을 로그는 포맷팅도 생략
         data = {
             'action': action,
             'symbol': symbol,
@@ -119,6 +239,8 @@ class Logger:
     def position(self, side: str, entry: float, current: float, 
                  pnl_pct: float, stop: float, target: float):
         """포지션 로그"""
+        if not self.enabled_for(LogLevel.INFO):
+            return  # 출력되지 않을 로그는 포맷팅도 생략
         data = {
             'side': side,
             'entry': f"${entry:,.2f}",
@@ -132,6 +254,8 @@ class Logger:
     def equity(self, current: float, initial: float, pnl: float, 
                drawdown: float):
         """자산 로그"""
+        if not self.enabled_for(LogLevel.INFO):
+            return  # 출력되지 않을 로그는 포맷팅도 생략
         data = {
             'equity': f"${current:,.2f}",
             'return': f"{(current/initial-1)*100:+.2f}%",
@@ -142,8 +266,17 @@ class Logger:
     
     def close(self):
         """로거 종료"""
+        if self._writer is not None:
+            if self._writer.is_alive():
+                self._queue.put(_STOP)
+                self._writer.join()
+            if self.dropped:
+                print(f"[Logger] 큐 적체로 버린 파일 로그 {self.dropped}건", file=sys.stderr)
+            self._writer = None
+            self._queue = None
         if self._file_handler:
             self._file_handler.close()
+            self._file_handler = None
 
 
 # 글로벌 로거
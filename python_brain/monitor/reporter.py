@@ -5,9 +5,11 @@
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-import json
 import sys
+
+import numpy as np
 sys.path.append('..')
+from infrastructure._json import dumps as json_dumps
 
 
 @dataclass
@@ -24,6 +26,91 @@ class TradeRecord:
     strategy: str = ""
 
 
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class TradeTable:
+    """
+    거래 기록 열 저장소 (TradeRecord 리스트 대신)
+    - timestamp: epoch 기준 마이크로초 int64 (naive datetime 그대로 왕복)
+    - price / size / pnl: float64 배열, 가득 차면 2배로 확장
+    - symbol / side / action / strategy: 문자열 → int16 코드로 intern
+    - reason: 자유 텍스트라 리스트로 보관
+    """
+    _NUMERIC = ("timestamp", "price", "size", "pnl")
+    _CODED = ("symbol", "side", "action", "strategy")
+    
+    def __init__(self, capacity: int = 1024):
+        self.n = 0
+        self.timestamp = np.empty(capacity, dtype=np.int64)
+        self.price = np.empty(capacity, dtype=np.float64)
+        self.size = np.empty(capacity, dtype=np.float64)
+        self.pnl = np.empty(capacity, dtype=np.float64)
+        for name in self._CODED:
+            setattr(self, name, np.empty(capacity, dtype=np.int16))
+        self.names = {name: [] for name in self._CODED}
+        self._codes = {name: {} for name in self._CODED}
+        self.reason: List[str] = []
+    
+    def _grow(self):
+        cap = len(self.pnl) * 2
+        for name in self._NUMERIC + self._CODED:
+            old = getattr(self, name)
+            new = np.empty(cap, dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+    
+    def code(self, column: str, value: str) -> int:
+        """문자열 → 코드 (처음 보는 값이면 등록)"""
+        codes = self._codes[column]
+        c = codes.get(value)
+        if c is None:
+            names = self.names[column]
+            c = codes[value] = len(names)
+            names.append(value)
+        return c
+    
+    def append(self, trade: TradeRecord):
+        if self.n == len(self.pnl):
+            self._grow()
+        i = self.n
+        self.timestamp[i] = (trade.timestamp - _EPOCH) // _MICROSECOND
+        self.price[i] = trade.price
+        self.size[i] = trade.size
+        self.pnl[i] = trade.pnl
+        for name in self._CODED:
+            getattr(self, name)[i] = self.code(name, getattr(trade, name))
+        self.reason.append(trade.reason)
+        self.n = i + 1
+    
+    def __len__(self) -> int:
+        return self.n
+    
+    def column(self, name: str) -> np.ndarray:
+        """기록된 구간의 열 뷰 (문자열 열은 코드, names[name]으로 복원)"""
+        return getattr(self, name)[:self.n]
+    
+    def record(self, i: int) -> TradeRecord:
+        """i번째 거래를 TradeRecord로 복원"""
+        names = self.names
+        return TradeRecord(
+            timestamp=_EPOCH + timedelta(microseconds=int(self.timestamp[i])),
+            symbol=names["symbol"][self.symbol[i]],
+            side=names["side"][self.side[i]],
+            action=names["action"][self.action[i]],
+            price=float(self.price[i]),
+            size=float(self.size[i]),
+            pnl=float(self.pnl[i]),
+            reason=self.reason[i],
+            strategy=names["strategy"][self.strategy[i]]
+        )
+    
+    def records(self, start: int = 0) -> List[TradeRecord]:
+        """start번째부터 끝까지 TradeRecord 리스트 (음수면 뒤에서부터)"""
+        return [self.record(i) for i in range(*slice(start, None).indices(self.n))]
+
+
 @dataclass
 class DailyStats:
     """일일 통계"""
@@ -49,8 +136,8 @@ class PerformanceReporter:
         self.initial_equity = initial_equity
         self.current_equity = initial_equity
         
-        # 거래 기록
-        self.trades: List[TradeRecord] = []
+        # 거래 기록 (열 저장)
+        self.table = TradeTable()
         
         # 일일 통계
         self.daily_stats: Dict[str, DailyStats] = {}
@@ -58,6 +145,11 @@ class PerformanceReporter:
         # 전략별 통계
         self.strategy_stats: Dict[str, Dict] = {}
         
+        # 전체 누적 (청산 거래 기준, record_trade에서 갱신 → get_summary가 trades를 순회하지 않음)
+        self._total_trades = 0
+        self._total_wins = 0
+        self._total_pnl = 0.0
+        
         # 현재 날짜
         self._current_date = datetime.now().strftime('%Y-%m-%d')
         self._today_stats = DailyStats(
@@ -82,7 +174,12 @@ class PerformanceReporter:
             strategy=strategy
         )
         
-        self.trades.append(trade)
+        self.table.append(trade)
+        
+        if action == "exit":
+            self._total_trades += 1
+            self._total_wins += pnl > 0
+            self._total_pnl += pnl
         
         # 일일 통계 업데이트
         self._update_daily_stats(trade)
@@ -90,6 +187,11 @@ class PerformanceReporter:
         # 전략별 통계 업데이트
         self._update_strategy_stats(trade)
     
+    @property
+    def trades(self) -> List[TradeRecord]:
+        """전체 거래 TradeRecord 리스트 (호출마다 새로 생성 - 집계는 table 열 사용)"""
+        return self.table.records()
+    
     def _update_daily_stats(self, trade: TradeRecord):
         """일일 통계 업데이트"""
         
@@ -109,10 +211,9 @@ class PerformanceReporter:
             self._today_stats.trades += 1
             self._today_stats.pnl += trade.pnl
             
-            if trade.pnl > 0:
-                self._today_stats.wins += 1
-            else:
-                self._today_stats.losses += 1
+            win = trade.pnl > 0
+            self._today_stats.wins += win
+            self._today_stats.losses += not win
     
     def _update_strategy_stats(self, trade: TradeRecord):
         """전략별 통계 업데이트"""
@@ -156,9 +257,9 @@ class PerformanceReporter:
     def get_summary(self) -> Dict:
         """전체 요약"""
         
-        total_trades = len([t for t in self.trades if t.action == "exit"])
-        wins = len([t for t in self.trades if t.action == "exit" and t.pnl > 0])
-        total_pnl = sum(t.pnl for t in self.trades if t.action == "exit")
+        total_trades = self._total_trades
+        wins = self._total_wins
+        total_pnl = self._total_pnl
         
         win_rate = (wins / total_trades * 100) if total_trades > 0 else 0
         
@@ -220,7 +321,7 @@ class PerformanceReporter:
     def get_recent_trades(self, n: int = 10) -> List[Dict]:
         """최근 거래"""
         
-        recent = self.trades[-n:]
+        recent = self.table.records(-n)
         return [
             {
                 'time': t.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
@@ -245,7 +346,7 @@ class PerformanceReporter:
             'strategies': self.get_strategy_report(),
             'trades': [
                 {
-                    'timestamp': t.timestamp.isoformat(),
+                    'timestamp': t.timestamp,
                     'symbol': t.symbol,
                     'side': t.side,
                     'action': t.action,
@@ -259,6 +360,7 @@ class PerformanceReporter:
             ]
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        # datetime은 인코더가 ISO 8601로 직렬화 (orjson 있으면 C 구현)
+        with open(filepath, 'wb') as f:
+            f.write(json_dumps(data, indent=True))
 
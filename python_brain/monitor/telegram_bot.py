@@ -2,7 +2,13 @@
 [텔레그램 알림]
 거래/경고 알림 전송
 """
+import atexit
+import threading
+import time
+from collections import deque
+
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Optional
 from datetime import datetime
 import sys
@@ -16,32 +22,98 @@ class TelegramNotifier:
     - 거래 알림
     - 경고 알림
     - 일일 리포트
+    
+    전송은 백그라운드 스레드가 큐에서 꺼내 처리 → 알림 호출이 매매 루프를 막지 않음
+    에러 알림은 별도 긴급 큐로 먼저 전송되고 버려지지 않음
+    종료 시 close(atexit 등록)가 남은 알림을 긴급 큐부터 제한 시간 안에 전송
     """
     
-    def __init__(self, token: str = None, chat_id: str = None):
+    def __init__(self, token: str = None, chat_id: str = None, queue_size: int = 256):
         self.token = token or settings.TELEGRAM_TOKEN
         self.chat_id = chat_id or settings.TELEGRAM_CHAT_ID
         self.enabled = bool(self.token and self.chat_id)
         
         if self.enabled:
             self.base_url = f"https://api.telegram.org/bot{self.token}"
+            self._send_url = f"{self.base_url}/sendMessage"
+            # keep-alive 세션 (알림마다 TLS 핸드셰이크 생략)
+            self._session = requests.Session()
+            self._session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
+            # 일반 큐는 가득 차면 가장 오래된 것부터 밀려남, 긴급 큐는 상한 없음
+            self._queue = deque(maxlen=queue_size)
+            self._urgent = deque()
+            self._cond = threading.Condition()
+            self._sending = False  # 큐에서 꺼내 전송 중인 메시지가 있는지 (close 대기용)
+            self._closed = False
+            threading.Thread(target=self._sender_loop, name="telegram-sender", daemon=True).start()
+            atexit.register(self.close)
             print(f"[Telegram] 알림 활성화")
         else:
             print(f"[Telegram] 알림 비활성화 (토큰/채팅ID 없음)")
     
-    def _send(self, message: str, parse_mode: str = "HTML") -> bool:
-        """메시지 전송"""
+    def _send(self, message: str, parse_mode: str = "HTML", urgent: bool = False) -> bool:
+        """
+        메시지 전송 예약
+
+        urgent=True는 긴급 큐로 들어가 일반 메시지보다 먼저 전송되며 버려지지 않음.
+        일반 큐가 가득 차면 가장 오래된 일반 메시지를 버림.
+
+        Returns:
+            True = 큐에 넣음 (전송 성공 여부가 아님, 확인이 필요하면 _send_blocking)
+        """
+        if not self.enabled or self._closed:
+            return False
+        
+        with self._cond:
+            (self._urgent if urgent else self._queue).append((message, parse_mode))
+            self._cond.notify_all()
+        return True
+    
+    def _sender_loop(self):
+        """큐 → Telegram API (전송 스레드, 긴급 큐 우선)"""
+        while True:
+            with self._cond:
+                while not self._urgent and not self._queue:
+                    self._cond.wait()
+                message, parse_mode = (self._urgent or self._queue).popleft()
+                self._sending = True
+            try:
+                self._send_blocking(message, parse_mode)
+            finally:
+                with self._cond:
+                    self._sending = False
+                    self._cond.notify_all()
+    
+    def close(self, timeout: float = 15.0):
+        """
+        남은 알림을 전송 스레드가 비울 때까지 최대 timeout초 대기 (이후 _send는 무시)
+        데몬 스레드라 대기 없이 종료하면 큐에 남은 알림이 조용히 사라짐
+        """
+        if not self.enabled or self._closed:
+            return
+        self._closed = True
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._urgent or self._queue or self._sending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    print(f"[Telegram] 종료 시 미전송 알림: 긴급 {len(self._urgent)}건 / 일반 {len(self._queue)}건",
+                          file=sys.stderr)
+                    return
+                self._cond.wait(remaining)
+    
+    def _send_blocking(self, message: str, parse_mode: str = "HTML") -> bool:
+        """메시지 즉시 전송 (응답까지 대기)"""
         if not self.enabled:
             return False
         
         try:
-            url = f"{self.base_url}/sendMessage"
             data = {
                 'chat_id': self.chat_id,
                 'text': message,
                 'parse_mode': parse_mode
             }
-            response = requests.post(url, data=data, timeout=10)
+            response = self._session.post(self._send_url, data=data, timeout=10)
             return response.ok
         except Exception as e:
             print(f"[Telegram] 전송 실패: {e}")
@@ -105,7 +177,7 @@ class TelegramNotifier:
 
 ⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
-        self._send(message)
+        self._send(message, urgent=True)
     
     def daily_report(self, stats: Dict):
         """일일 리포트"""
@@ -135,6 +207,6 @@ class TelegramNotifier:
         self._send(message)
     
     def test_connection(self) -> bool:
-        """연결 테스트"""
-        return self._send("🤖 Bot Connected!")
+        """연결 테스트 (결과가 필요하므로 동기 전송)"""
+        return self._send_blocking("🤖 Bot Connected!")
 
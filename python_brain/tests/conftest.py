@@ -0,0 +1,5 @@
+import os
+import sys
+
+# python_brain 루트를 import 경로에 추가 (core / infrastructure / monitor를 최상위 패키지로 사용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
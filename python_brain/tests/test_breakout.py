@@ -0,0 +1,33 @@
+"""
+BreakoutStrategy 목표가 ADX 보너스 - 기준점(ADX_BONUS_BASE)은 진입 문턱(MIN_ADX)과 독립
+"""
+import pytest
+
+from core.features import MarketFeatures, MarketFeaturesBatch
+from core.strategies import BreakoutStrategy
+
+
+def _long_features(adx, volume_z=1.0):
+    price, atr_pct = 100.0, 0.01
+    return MarketFeatures(price, atr_pct, price * atr_pct, adx, 0.001, 0.001,
+                          volume_z, 0.0, 0.0, 0.0)
+
+
+@pytest.mark.parametrize("min_adx", [20, 25, 30])
+def test_adx_bonus_anchor_ignores_min_adx(min_adx):
+    s = BreakoutStrategy(MIN_ADX=min_adx)
+    f = _long_features(adx=35.0)
+    sig = s.generate(f)
+
+    # (35 - 25) * 0.05 = 0.5 → tp 2.0 + 0.5 ATR, MIN_ADX와 무관
+    assert sig.target == pytest.approx(f.price + f.atr_value * 2.5)
+
+    batch = MarketFeaturesBatch.from_features([f])
+    direction, _, _, target = s.generate_batch(batch)
+    assert direction[0] == 1
+    assert target[0] == pytest.approx(sig.target)
+
+
+def test_adx_bonus_base_override():
+    sig = BreakoutStrategy(ADX_BONUS_BASE=30).generate(_long_features(adx=35.0))
+    assert sig.target == pytest.approx(100.0 + 1.0 * 2.25)
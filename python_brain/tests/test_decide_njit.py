@@ -0,0 +1,81 @@
+"""
+core.decide_njit.decide와 전략 클래스 generate(기준 구현)의 일치 검사
+
+커널은 전략 본문의 리터럴(0.0005 / 0.0003 / 0.015 등)을 그대로 복제하므로
+임계값 경계를 포함한 격자에서 regime / 방향 / 손절 / 목표가 완전히 같아야 한다.
+"""
+import itertools
+
+import numpy as np
+import pytest
+
+from core.decide_njit import decide, strategy_params
+from core.engine import STRATEGY_IDS
+from core.features import MarketFeatures
+from core.regime import REGIME_BY_CODE, detect_regime
+from core.strategies import BreakoutStrategy, MeanReversionStrategy, TrendStrategy
+
+# 각 축: 전략/regime 임계값 바로 위·아래와 경계값 자체
+ATR_PCT = (0.004, 0.005, 0.006, 0.008, 0.015, 0.02)
+ADX = (17.0, 18.0, 20.0, 22.0, 23.0, 25.0, 30.0, 45.0)
+EMA_FAST = (-0.002, -0.001, -0.0005, 0.0005, 0.001, 0.002)
+EMA_SLOW = (-0.001, 0.0, 0.001)
+VOLUME_Z = (0.8, 1.2, 2.0, 2.5)
+FUNDING = (-0.0003, -0.0001, 0.0, 0.0002, 0.0003, 0.0004)
+RET_1 = (-0.005, -0.003, 0.003, 0.006)
+RET_5 = (-0.02, -0.012, 0.0, 0.012, 0.025)
+
+
+def _grid():
+    for atr_pct, adx, ema_fast, ema_slow, volume_z, funding, ret_1, ret_5 in itertools.product(
+            ATR_PCT, ADX, EMA_FAST, EMA_SLOW, VOLUME_Z, FUNDING, RET_1, RET_5):
+        price = 100.0
+        yield MarketFeatures(price, atr_pct, price * atr_pct, adx, ema_fast, ema_slow,
+                             volume_z, funding, ret_1, ret_5)
+
+
+def _expected(f, strategies):
+    regime = detect_regime(f)
+    out = np.zeros((len(STRATEGY_IDS), 3))
+    for s in strategies:
+        sig = s.generate(f)
+        if sig is not None:
+            out[STRATEGY_IDS[s.name]] = (1.0 if sig.direction == "long" else -1.0, sig.stop, sig.target)
+    return regime, out
+
+
+def _regime_strategies(strategies):
+    by_name = {s.name: s for s in strategies}
+    return {
+        "trend": (by_name["breakout"], by_name["trend"]),
+        "distribution": (by_name["mean_reversion"],),
+    }
+
+
+@pytest.mark.parametrize("kernel", [decide, getattr(decide, "py_func", decide)], ids=["compiled", "python"])
+@pytest.mark.parametrize("params", [
+    {},
+    {"breakout": {"MIN_ADX": 30, "BASE_TP_ATR": 2.5}, "trend": {"STRONG_ADX": 25},
+     "mean_reversion": {"WEAK_DIP": -0.01, "BASE_SL_ATR": 1.0}},
+], ids=["default", "overridden"])
+def test_decide_matches_strategy_generate(kernel, params):
+    strategies = (
+        BreakoutStrategy(**params.get("breakout", {})),
+        TrendStrategy(**params.get("trend", {})),
+        MeanReversionStrategy(**params.get("mean_reversion", {})),
+    )
+    pool = _regime_strategies(strategies)
+    p = strategy_params(*strategies)
+    out = np.zeros((len(STRATEGY_IDS), 3))
+    fired = set()
+
+    for f in _grid():
+        code = kernel(f.price, f.atr_pct, f.atr_value, f.adx, f.ema_fast_slope, f.ema_slow_slope,
+                      f.volume_z, f.funding_rate, f.ret_1, f.ret_5, *p, out)
+        regime, expected = _expected(f, pool.get(detect_regime(f).value, ()))
+        assert REGIME_BY_CODE[code] is regime, f
+        assert np.array_equal(out, expected), f
+        fired.update((sid, int(expected[sid, 0])) for sid in np.flatnonzero(expected[:, 0]))
+
+    # 격자가 실제로 세 전략의 롱/숏 경로를 모두 지나는지
+    assert fired == {(sid, sign) for sid in STRATEGY_IDS.values() for sign in (1, -1)}